@@ -1,8 +1,21 @@
-import json
+import sys
+from pathlib import Path
 
-data = json.load(open('data/video-script.json', 'r', encoding='utf-8'))
+from src.utils.script_io import load_cached
 
-print("=== IMAGES TIMING ===")
-for i, seg in enumerate(data['video_plan']):
-    for img in seg.get('contextual_images', []):
-        print(f"Seg {i}: {img['id']} -> {img['start_time']}s to {img['end_time']}s")
+SCRIPT_PATH = Path(__file__).resolve().parent / 'data' / 'video-script.json'
+
+
+def check_image_timing(data):
+    """Print the contextual image windows of an already-loaded video script."""
+    lines = ["=== IMAGES TIMING ==="]
+    lines.extend(
+        f"Seg {i}: {img['id']} -> {img['start_time']}s to {img['end_time']}s"
+        for i, seg in enumerate(data['video_plan'])
+        for img in seg.get('contextual_images', [])
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    check_image_timing(load_cached(SCRIPT_PATH, keep_words=False))
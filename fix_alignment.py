@@ -1,28 +1,59 @@
-import re
+import ast
+import os
+from pathlib import Path
 
-# Read the file
-with open('src/core/asset_assembler.py', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+PATH = Path(__file__).resolve().parent / 'src' / 'core' / 'asset_assembler.py'
+TARGET_TEST = "visual_assets and isinstance(visual_assets, list) and visual_assets"
 
-# Find the line numbers we need to replace
+
+def find_block(tree):
+    """
+    Return (if_node, next_statement) for the visual_assets block.
+
+    The block is matched structurally on its test expression, so comments,
+    spacing or similar-looking lines elsewhere in the file don't affect it.
+    The replaced region runs up to the statement that follows the if.
+    """
+    for parent in ast.walk(tree):
+        for field in ('body', 'orelse', 'finalbody'):
+            stmts = getattr(parent, field, None)
+            if not isinstance(stmts, list):
+                continue
+            for pos, stmt in enumerate(stmts):
+                if isinstance(stmt, ast.If) and ast.unparse(stmt.test) == TARGET_TEST:
+                    following = stmts[pos + 1] if pos + 1 < len(stmts) else None
+                    return stmt, following
+    return None, None
+
+
+source = PATH.read_bytes()
+
+node, following = find_block(ast.parse(source, str(PATH)))
 start_line = None
 end_line = None
 
-for i, line in enumerate(lines):
-    if 'if visual_assets and isinstance(visual_assets, list) and visual_assets:' in line:
-        start_line = i
-    if start_line and 'transition_sound = None' in line:
-        end_line = i
-        break
+if node is not None:
+    lines = source.splitlines(keepends=True)
+    start_line = node.lineno - 1
+    end_line = following.lineno - 1 if following is not None else node.end_lineno
+    head = b"".join(lines[:start_line])
+    tail = b"".join(lines[end_line:])
 
-print(f"Found block from line {start_line+1} to {end_line+1}")
+if start_line is not None:
+    print(f"Found block from line {start_line+1} to {end_line+1}")
 
-if start_line and end_line:
     # Get the indentation
-    indent = '            '
+    indent = ' ' * node.col_offset
     
     new_block = f'''{indent}if visual_assets and isinstance(visual_assets, list) and visual_assets:
 {indent}    filtered_assets = [va for va in visual_assets if va.get('visual_asset_id') != used_opening_id]
+{indent}    # Word timing as parallel lists, indexed directly per asset
+{indent}    starts = [w['start'] for w in words]
+{indent}    ends = [w['end'] for w in words]
+{indent}    last_idx = len(words) - 1
+{indent}    # Whole-segment window for assets without word indices
+{indent}    seg_start = starts[0] if words else segment.get('start', 0)
+{indent}    seg_end = ends[-1] if words else segment.get('end', 0)
 {indent}    
 {indent}    for va in filtered_assets:
 {indent}        visual_id = va.get('visual_asset_id')
@@ -34,13 +65,11 @@ if start_line and end_line:
 {indent}        end_idx = va.get('end_word_index')
 {indent}        
 {indent}        if start_idx is not None and words:
-{indent}            start_idx = max(0, min(start_idx, len(words) - 1))
-{indent}            end_idx = max(start_idx, min(end_idx or start_idx, len(words) - 1))
-{indent}            start_t = words[start_idx]['start']
-{indent}            end_t = words[end_idx]['end']
+{indent}            start_idx = max(0, min(start_idx, last_idx))
+{indent}            end_idx = max(start_idx, min(end_idx or start_idx, last_idx))
+{indent}            start_t = starts[start_idx]
+{indent}            end_t = ends[end_idx]
 {indent}        else:
-{indent}            seg_start = words[0]['start'] if words else segment.get('start', 0)
-{indent}            seg_end = words[-1]['end'] if words else segment.get('end', 0)
 {indent}            start_t, end_t = seg_start, seg_end
 {indent}
 {indent}        contextual_images.append({{
@@ -53,11 +82,11 @@ if start_line and end_line:
 
 '''
     
-    # Replace lines
-    new_lines = lines[:start_line] + [new_block] + lines[end_line:]
-    
-    with open('src/core/asset_assembler.py', 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+    # Replace the block and swap the file in atomically
+    tmp_path = PATH.with_name(PATH.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.writelines((head, new_block.encode('utf-8'), tail))
+    os.replace(tmp_path, PATH)
     
     print("OK - File updated!")
 else:
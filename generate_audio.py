@@ -1,24 +1,35 @@
 
+import asyncio
 import json
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add src to python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.core.elevenlabs import generate_audio_from_script
+_CONFIG = None
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python generate_audio.py <script_json_path>")
-        sys.exit(1)
 
-    script_path = Path(sys.argv[1])
-    if not script_path.exists():
-        print(f"Error: Script file not found at {script_path}")
-        sys.exit(1)
+def _get_config():
+    """Voice settings, read from the environment once per process."""
+    global _CONFIG
+    if _CONFIG is None:
+        # You might need to adjust these voice IDs or load them from env/config
+        _CONFIG = {
+            "voice_id_skeptic": os.getenv("VOICE_ID_SKEPTIC", "iP95p4xoSX5wMGTk13qQ"),  # Charles
+            "voice_id_analyst": os.getenv("VOICE_ID_ANALYST", "9BWtsMINqrJLrRacOk9x"),  # Aria/Eve equivalent
+        }
+    return _CONFIG
+
+
+def generate_for_script(script_path, force=False, config=None):
+    """Generate the dialogue audio for one script file. Returns the output path."""
+    # Imported only once the arguments are known to be usable: the ElevenLabs
+    # client (and its dotenv load) is the bulk of this script's startup time.
+    from src.core.elevenlabs import generate_audio_from_script_async
+
+    config = config or _get_config()
 
     with open(script_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
@@ -34,26 +45,47 @@ def main():
     
     dialogue = script_content.get("dialogue", [])
     
-    # You might need to adjust these voice IDs or load them from env/config
-    # Using defaults or env vars if available, else placeholders
-    # In the actual code these seem to be passed or hardcoded? 
-    # Let's check how they are usually passed. 
-    # For now I will use placeholders that the user must fill or env vars.
-    voice_id_skeptic = os.getenv("VOICE_ID_SKEPTIC", "iP95p4xoSX5wMGTk13qQ") # Charles
-    voice_id_analyst = os.getenv("VOICE_ID_ANALYST", "9BWtsMINqrJLrRacOk9x") # Aria/Eve equivalent
-    
     print(f"Generating audio for script: {script_id}")
-    try:
-        generate_audio_from_script(
-            dialogue=dialogue,
-            output_file=str(audio_output),
-            voice_id_skeptic=voice_id_skeptic,
-            voice_id_analyst=voice_id_analyst
-        )
-        print(f"Done! Audio saved to {audio_output}")
-    except Exception as e:
-        print(f"Error generating audio: {e}")
+    asyncio.run(generate_audio_from_script_async(
+        dialogue=dialogue,
+        output_file=str(audio_output),
+        voice_id_skeptic=config["voice_id_skeptic"],
+        voice_id_analyst=config["voice_id_analyst"],
+        cache_dir=str(base_dir / "audio" / ".cache"),
+        force=force
+    ))
+    return audio_output
+
+
+def main(argv=None):
+    """
+    Generate audio for one or more scripts in this process.
+
+    argv defaults to sys.argv[1:]; a driver can call main([path, ...])
+    repeatedly and reuse the loaded config and ElevenLabs import.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    args = [a for a in argv if a != "--force"]
+    force = len(args) != len(argv)
+
+    if not args:
+        print("Usage: python generate_audio.py <script_json_path> [<script_json_path> ...] [--force]")
         sys.exit(1)
 
+    script_paths = [Path(a) for a in args]
+    for script_path in script_paths:
+        if not script_path.exists():
+            print(f"Error: Script file not found at {script_path}")
+            sys.exit(1)
+
+    for script_path in script_paths:
+        try:
+            audio_output = generate_for_script(script_path, force=force)
+            print(f"Done! Audio saved to {audio_output}")
+        except Exception as e:
+            print(f"Error generating audio: {e}")
+            sys.exit(1)
+
 if __name__ == "__main__":
     main()
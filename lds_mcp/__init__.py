@@ -3,17 +3,22 @@ Zero Sum LDS MCP Server
 Model Context Protocol server for creating LDS short-form video content.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Zero Sum Media"
 
-from .tools import (
-    create_lds_script,
-    search_lds_content,
-    search_world_news,
-    verify_lds_quote,
-    ImageManager,
-    render_short_video,
-)
+# Public name -> submodule that defines it. Resolved on first access (PEP 562)
+# so that importing the package, or one tool, doesn't load every tool's
+# dependencies (the renderer alone pulls in the whole video stack).
+_LAZY = {
+    "create_lds_script": ".tools.script_generator",
+    "search_lds_content": ".tools.content_search",
+    "search_world_news": ".tools.content_search",
+    "verify_lds_quote": ".tools.quote_verifier",
+    "ImageManager": ".tools.image_manager",
+    "render_short_video": ".tools.short_renderer",
+}
 
 __all__ = [
     "create_lds_script",
@@ -23,3 +28,16 @@ __all__ = [
     "ImageManager",
     "render_short_video",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
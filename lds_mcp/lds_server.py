@@ -16,12 +16,26 @@ Key Features (v2.0):
 Run with: python server.py
 """
 
-import json
+import asyncio
+import contextlib
+import functools
+import logging
 import os
+import re
+import shutil
+import signal
+import stat
+import subprocess
 import sys
+import tempfile
+import time
+import traceback
+import uuid
 import importlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -38,16 +52,18 @@ from mcp.types import (
     GetPromptResult,
 )
 from pydantic import AnyUrl
+import orjson
 
-# Import core modules (use lds_mcp to avoid conflicts with mcp package)
-from src.core.elevenlabs import generate_audio_from_script
+# Import core modules (use lds_mcp to avoid conflicts with mcp package).
+# The ElevenLabs client and the renderer are imported by the handlers that
+# use them, so starting the server (list_tools, get_status) doesn't load them.
 from lds_mcp.tools.script_generator import create_lds_script
 from lds_mcp.tools.content_search import search_lds_content, search_world_news
 from lds_mcp.tools.quote_verifier import verify_lds_quote
 from lds_mcp.tools.image_manager import ImageManager
-from lds_mcp.tools.short_renderer import render_short_video, execute_render, validate_render_prerequisites
-from lds_mcp.tools.project_manager import get_project_manager
-from lds_mcp.tools.file_manager import handle_file_operation, FileManager
+from lds_mcp.tools.project_manager import ProjectPaths, get_project_manager
+from lds_mcp.tools.file_manager import handle_file_operation
+from lds_mcp.tools.render_status import iso_now, write_status_atomic
 from lds_mcp.tools.workflow import handle_workflow_operation
 from lds_mcp.tools.project_state import (
     get_state_manager,
@@ -55,6 +71,9 @@ from lds_mcp.tools.project_state import (
     ProjectPhase
 )
 
+# stdout carries the MCP protocol, so diagnostics go through logging (stderr)
+logger = logging.getLogger("lds_mcp")
+
 
 def reload_render_modules():
     """
@@ -70,20 +89,103 @@ def reload_render_modules():
         if module_name in sys.modules:
             try:
                 importlib.reload(sys.modules[module_name])
-                print(f"[MCP] Reloaded: {module_name}", file=sys.stderr)
+                logger.debug("Reloaded: %s", module_name)
             except Exception as e:
-                print(f"[MCP] Failed to reload {module_name}: {e}", file=sys.stderr)
+                logger.warning("Failed to reload %s: %s", module_name, e)
 
 # Initialize server
 server = Server("zero-sum-lds")
 
 # Data paths
 DATA_DIR = Path(__file__).parent.parent / "data"
+_DATA_PARENT = DATA_DIR.parent  # Repository root, the base_dir every manager expects
 SHORTS_DIR = DATA_DIR / "shorts"
 IMAGES_DIR = DATA_DIR / "images"
 
+_SCRIPTS_DIR = SHORTS_DIR / "scripts"
+_AUDIO_DIR = SHORTS_DIR / "audio"
+_OUTPUT_DIR = SHORTS_DIR / "output"
+_SHORT_IMAGES_DIR = SHORTS_DIR / "images"  # Per-project images (IMAGES_DIR is the shared library)
+_STATUS_FILE = SHORTS_DIR / "render_status.json"
+_RESULT_FILE = SHORTS_DIR / "render_result.json"
+_LOG_FILE = DATA_DIR / "render_log.txt"
+
+# execute_render's worker command and its stdout log, fixed for the process
+_PY_EXEC = sys.executable  # Same interpreter as the server
+_WORKER_SCRIPT = os.fspath((Path(__file__).parent / "tools" / "render_worker.py").resolve())
+_WORKER_LOG = os.fspath(DATA_DIR / "render_worker.log")
+
+# Plain-string forms for the status probes, which never need a Path object
+_SCRIPTS_DIR_STR = os.fspath(_SCRIPTS_DIR)
+_AUDIO_DIR_STR = os.fspath(_AUDIO_DIR)
+_OUTPUT_DIR_STR = os.fspath(_OUTPUT_DIR)
+_SHORT_IMAGES_DIR_STR = os.fspath(_SHORT_IMAGES_DIR)
+
+# Directories already created (or found) by _ensure_dir
+_MKDIR_CACHE: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p, skipping the syscall for directories handled earlier."""
+    if path not in _MKDIR_CACHE:
+        path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(path)
+
+
 # Ensure directories exist
-SHORTS_DIR.mkdir(parents=True, exist_ok=True)
+_ensure_dir(SHORTS_DIR)
+
+# One project manager for the life of the server (it creates the project dirs)
+_PM = get_project_manager(_DATA_PARENT)
+# Same for the state manager; this also pins the shared instance to our data dir
+_STATE = get_state_manager(_DATA_PARENT)
+
+# Built on first upload_images call; dropped when archive/cleanup remove the folder
+_IMAGE_MANAGER: ImageManager | None = None
+
+
+def _reset_image_manager() -> None:
+    global _IMAGE_MANAGER
+    _IMAGE_MANAGER = None
+
+
+def _image_manager() -> ImageManager:
+    global _IMAGE_MANAGER
+    if _IMAGE_MANAGER is None:
+        _IMAGE_MANAGER = ImageManager(_SHORT_IMAGES_DIR)
+    return _IMAGE_MANAGER
+
+
+# Caps how many blocking project-folder jobs (archive, cleanup, listings)
+# hold worker threads at once, so render status polls still get one
+_FS_SLOTS = asyncio.Semaphore(4)
+
+
+async def _run_fs(func, /, *args, **kwargs):
+    """Run a blocking filesystem call off the event loop."""
+    async with _FS_SLOTS:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+@functools.lru_cache(maxsize=128)
+def _project_paths(project_id: str) -> ProjectPaths:
+    """Paths for an explicit project id; they depend on nothing else, so build them once."""
+    return _PM.get_paths(project_id)
+
+
+@functools.lru_cache(maxsize=128)
+def _script_path(script_id: str) -> Path:
+    return _SCRIPTS_DIR / f"{script_id}.json"
+
+# Background render jobs started by execute_render: job_id -> process info.
+# Finished jobs move to _JOB_RESULTS (see _reap_jobs) so repeated polls don't
+# re-read files.
+_JOBS: dict[str, dict] = {}
+_JOB_RESULTS: dict[str, tuple[float, dict]] = {}
+_JOB_RESULT_TTL = 600  # seconds
+# How long execute_render watches a fresh worker for an immediate crash
+_WORKER_STARTUP_GRACE = 0.5  # seconds
+_WORKER_STARTUP_POLL = 0.05
 
 # Character configuration for LDS content
 # IMPORTANT: Character names must match exactly for ElevenLabs voice mapping
@@ -104,1276 +206,1744 @@ CHARACTERS = {
         "tags": "[curious], [thoughtfully], [surprised], [realizing], [pondering], [nervous laugh], [sighs]"
     }
 }
+# Read-only from here on
+CHARACTERS = MappingProxyType({key: MappingProxyType(value) for key, value in CHARACTERS.items()})
+VOICE_ID_ANALYST = CHARACTERS["analyst"]["voice_id"]
+VOICE_ID_SKEPTIC = CHARACTERS["skeptic"]["voice_id"]
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available MCP tools."""
-    return [
-        Tool(
-            name="create_script",
-            description="""Create a short-form video script (1-2 minutes) for LDS content.
-
-            The script features two characters:
-            - Sister Faith: Knowledgeable member who cites prophets, scriptures, testimonies
-            - Brother Marcus: Curious member learning about doctrine
-
-            Returns a JSON script ready for audio generation.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "The main topic (e.g., 'The First Vision', 'Faith in Jesus Christ')"
-                    },
-                    "topic_context": {
-                        "type": "string",
-                        "description": "Additional context, scriptures, or prophet quotes to include"
-                    },
-                    "hook_question": {
-                        "type": "string",
-                        "description": "A compelling question or phrase for the video overlay (3-5 words)"
-                    },
-                    "duration_seconds": {
-                        "type": "integer",
-                        "description": "Target duration in seconds (60-120 recommended)",
-                        "default": 60
-                    }
-                },
-                "required": ["topic"]
-            }
-        ),
-        Tool(
-            name="search_lds_content",
-            description="""Search for LDS scriptures, prophet quotes, and church content.
-
-            Sources:
-            - Book of Mormon, Doctrine & Covenants, Pearl of Great Price
-            - General Conference talks
-            - Liahona magazine
-            - Church news and official statements
-
-            Returns verified quotes with sources.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'faith', 'Joseph Smith First Vision')"
-                    },
-                    "source_type": {
-                        "type": "string",
-                        "enum": ["scriptures", "conference", "liahona", "all"],
-                        "description": "Type of source to search",
-                        "default": "all"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results",
-                        "default": 5
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="search_world_news",
-            description="""Search for recent world news and find relevant LDS teachings.
-
-            Helps create content that connects current events with gospel principles.
-            Returns news summaries with suggested scripture/prophet connections.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "News topic to search (e.g., 'peace', 'hope', 'family')"
-                    },
-                    "find_gospel_connection": {
-                        "type": "boolean",
-                        "description": "Whether to suggest related gospel teachings",
-                        "default": True
-                    }
-                },
-                "required": ["topic"]
-            }
-        ),
-        Tool(
-            name="verify_quote",
-            description="""Verify if a prophet quote or scripture reference is accurate.
-
-            IMPORTANT: Always use this before including quotes in scripts to avoid misinformation.
-            Returns verification status and correct citation if found.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "quote": {
-                        "type": "string",
-                        "description": "The quote text to verify"
-                    },
-                    "attributed_to": {
-                        "type": "string",
-                        "description": "Who the quote is attributed to (e.g., 'President Nelson', 'Moroni')"
-                    },
-                    "source": {
-                        "type": "string",
-                        "description": "Optional: claimed source (e.g., 'October 2023 Conference')"
-                    }
-                },
-                "required": ["quote", "attributed_to"]
-            }
-        ),
-        Tool(
-            name="upload_images",
-            description="""Register manually uploaded images for video assembly.
-
-            Upload images to be used in the video. The system will intelligently
-            order them based on the script content.
-
-            Images should be placed in: data/shorts/images/
-            Returns a list of registered images with suggested placements.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "image_descriptions": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "filename": {"type": "string"},
-                                "description": {"type": "string"}
-                            }
-                        },
-                        "description": "List of images with descriptions for intelligent ordering"
-                    },
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script to associate images with"
-                    }
-                },
-                "required": ["image_descriptions"]
-            }
-        ),
-        Tool(
-            name="generate_audio",
-            description="""Generate audio from a script using ElevenLabs voices.
-
-            Uses:
-            - Sister Faith: Eve voice (professional, calm)
-            - Brother Marcus: Charles voice (young, curious)
-
-            Returns path to generated audio file.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script to generate audio for"
-                    },
-                    "script_json": {
-                        "type": "object",
-                        "description": "Alternatively, pass the script JSON directly"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="validate_render",
-            description="""IMPORTANT: Call this BEFORE execute_render to catch issues early!
-
-            Validates all render prerequisites to avoid wasted render time:
-            - Character images exist (correct format/extension)
-            - Visual assets/floating images can be found
-            - Script structure is valid
-            - Audio and timestamps exist
-
-            Returns a detailed validation report with:
-            - errors: Issues that MUST be fixed before rendering
-            - warnings: Issues that may affect quality but won't stop render
-            - info: Helpful information about what was found
-
-            ALWAYS call this before execute_render to save time!""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script to validate"
-                    }
-                },
-                "required": ["script_id"]
-            }
-        ),
-        Tool(
-            name="render_short",
-            description="""Prepare a short-form video render plan (9:16 vertical format).
-
-            Validates all prerequisites and prepares the render configuration.
-            Use execute_render to actually render the video.
-
-            Output: Render plan ready for execution""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script to render"
-                    },
-                    "hook_text": {
-                        "type": "string",
-                        "description": "Text to display at top of video (3-5 words)"
-                    },
-                    "opening_image": {
-                        "type": "string",
-                        "description": "Path to opening/thumbnail image"
-                    },
-                    "output_filename": {
-                        "type": "string",
-                        "description": "Output filename (without extension)",
-                        "default": "short_video"
-                    }
-                },
-                "required": ["script_id", "hook_text"]
-            }
-        ),
-        Tool(
-            name="execute_render",
-            description="""Execute the video render and create the final MP4 file.
-
-            This tool ACTUALLY renders the video using FFmpeg/PyAV.
-            It creates the final short-form video (9:16 vertical, 1080x1920).
-
-            Assembles:
-            - Opening image/thumbnail with fade
-            - Hook text overlay (top of video)
-            - Character poses with lip sync
-            - Audio narration
-            - Word-by-word captions
-
-            Output: Final MP4 file ready for TikTok/Instagram Reels/YouTube Shorts
-
-            NOTE: This may take 1-5 minutes depending on video length.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script to render"
-                    },
-                    "hook_text": {
-                        "type": "string",
-                        "description": "Text to display at top of video (3-5 words)"
-                    },
-                    "opening_image": {
-                        "type": "string",
-                        "description": "Path to opening/thumbnail image (optional)"
-                    },
-                    "output_filename": {
-                        "type": "string",
-                        "description": "Output filename (without extension)",
-                        "default": "short_video"
-                    }
-                },
-                "required": ["script_id", "hook_text"]
-            }
-        ),
-        Tool(
-            name="get_render_log",
-            description="""Get the render log file content to see what happened during rendering.
-
-            Use this tool AFTER calling execute_render to see:
-            - What step the render is on
-            - Any errors that occurred
-            - Progress information
-
-            This is essential for debugging render issues.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tail_lines": {
-                        "type": "integer",
-                        "description": "Number of lines from end to return (default: 100)",
-                        "default": 100
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="check_render_status",
-            description="""Check the current status of a background render.
-
-            Returns:
-            - phase: current phase (starting, importing, rendering, complete, error)
-            - message: human-readable status message
-            - progress: percentage complete (0-100)
-            - last_updated: when status was last updated
-            - logs: last 20 lines from render log
-
-            Use this to monitor render progress in real-time.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_id": {
-                        "type": "string",
-                        "description": "ID of the script being rendered (optional)"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="stop_render",
-            description="""Stop a running render process.
-
-            Use this if:
-            - Render is taking too long
-            - You need to make changes and re-render
-            - Something went wrong
-
-            Requires the PID from execute_render or check_render_status.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pid": {
-                        "type": "integer",
-                        "description": "Process ID of the render worker to stop"
-                    },
-                    "force": {
-                        "type": "boolean",
-                        "description": "Force kill (SIGKILL) instead of graceful stop",
-                        "default": False
-                    }
-                },
-                "required": ["pid"]
-            }
-        ),
-        Tool(
-            name="list_projects",
-            description="""List all current short video projects and their status.""",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_project_status",
-            description="""Get detailed status of a specific project.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID to check"
-                    }
-                },
-                "required": ["project_id"]
-            }
-        ),
-        Tool(
-            name="save_script",
-            description="""Save a generated script to the project.
-
-            IMPORTANT: Call this after generating a script JSON to save it to disk.
-            This ensures the script is available for audio generation and rendering.
-
-            The script will be:
-            1. Saved to data/shorts/scripts/{project_id}.json
-            2. Also saved to data/production_plan.json for CLI compatibility
-            3. Set as the current active project
-
-            Returns the project_id for subsequent operations.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_json": {
-                        "type": "object",
-                        "description": "The complete script JSON object to save"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Optional: Override the project ID (defaults to script.id or auto-generated)"
-                    }
-                },
-                "required": ["script_json"]
-            }
-        ),
-        Tool(
-            name="manage_files",
-            description="""Manage files within the project (copy, move, list, register images).
-
-            Operations:
-            - copy: Copy a file from any location to the project
-            - move: Move a file within the project
-            - register_images: Copy multiple images to a project's images folder
-            - list: List directory contents
-            - list_project_images: List images registered for a project
-            - mkdir: Create a directory
-            - delete: Delete a file (requires confirm=true)
-
-            Use this to:
-            - Copy images from Downloads or other folders to the project
-            - Organize project files
-            - List available images""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "enum": ["copy", "move", "register_images", "list", "list_project_images", "mkdir", "delete"],
-                        "description": "The file operation to perform"
-                    },
-                    "source": {
-                        "type": "string",
-                        "description": "Source file path (for copy/move)"
-                    },
-                    "destination": {
-                        "type": "string",
-                        "description": "Destination path (for copy/move)"
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "Directory path (for list/mkdir/delete)"
-                    },
-                    "image_paths": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of image paths (for register_images)"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID (for register_images/list_project_images)"
-                    },
-                    "pattern": {
-                        "type": "string",
-                        "description": "Glob pattern for filtering (for list)",
-                        "default": "*"
-                    },
-                    "overwrite": {
-                        "type": "boolean",
-                        "description": "Overwrite existing files",
-                        "default": False
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Confirm deletion (required for delete)",
-                        "default": False
-                    }
-                },
-                "required": ["operation"]
-            }
-        ),
-        Tool(
-            name="workflow",
-            description="""High-level workflow operations for streamlined video creation.
-
-            Operations:
-            - create_project: Initialize a new video project with topic
-            - finalize_script: Validate and save a generated script JSON
-            - produce_video: Check prerequisites and prepare for rendering
-            - get_summary: Get actionable project status
-
-            RECOMMENDED FLOW:
-            1. workflow(operation="create_project", topic="Your Topic")
-            2. [Generate script JSON based on instructions]
-            3. workflow(operation="finalize_script", script_json={...})
-            4. generate_audio(script_id="...")
-            5. render_short(script_id="...", hook_text="...")
-
-            This tool provides clearer guidance at each step.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "enum": ["create_project", "finalize_script", "produce_video", "get_summary"],
-                        "description": "The workflow operation to perform"
-                    },
-                    "topic": {
-                        "type": "string",
-                        "description": "Video topic (for create_project)"
-                    },
-                    "topic_context": {
-                        "type": "string",
-                        "description": "Additional context, quotes, scriptures (for create_project)"
-                    },
-                    "hook_question": {
-                        "type": "string",
-                        "description": "Catchy question for video overlay (for create_project)"
-                    },
-                    "duration_seconds": {
-                        "type": "integer",
-                        "description": "Target video duration (for create_project)",
-                        "default": 75
-                    },
-                    "script_json": {
-                        "type": "object",
-                        "description": "The generated script JSON (for finalize_script)"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID (optional, uses current project if not specified)"
-                    }
-                },
-                "required": ["operation"]
-            }
-        ),
-        Tool(
-            name="get_status",
-            description="""Get current project status and phase.
-
-            CALL THIS FIRST when starting a new chat to understand:
-            - What project is active (if any)
-            - What phase we're in (idea, script, audio, render, complete)
-            - What files exist
-            - What the next steps are
-
-            This helps avoid confusion and conflicts between projects.""",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="archive_project",
-            description="""Archive the current project to old-videos folder.
-
-            Use this when:
-            - A video is complete and you want to start fresh
-            - You want to clean up before a new project
-            - There are leftover files from a previous project
-
-            Archives all project files (script, audio, timestamps, video) to:
-            old-videos/{project_id}_{timestamp}/
-
-            After archiving, the system is ready for a new project.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "delete_source": {
-                        "type": "boolean",
-                        "description": "Delete source files after archiving (default: true)",
-                        "default": True
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID to archive (uses current if not specified)"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="cleanup_workspace",
-            description="""Clean up all project files to start completely fresh.
-
-            This will:
-            1. Archive the current project (if any)
-            2. Remove all files from data/shorts/
-            3. Reset project state
-
-            Use with caution - this removes all current project data.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "archive_first": {
-                        "type": "boolean",
-                        "description": "Archive current project before cleanup (default: true)",
-                        "default": True
-                    },
-                    "confirm": {
-                        "type": "boolean",
-                        "description": "Confirm cleanup action (required)",
-                        "default": False
-                    }
-                },
-                "required": ["confirm"]
-            }
-        ),
-        Tool(
-            name="list_archived",
-            description="""List all archived projects in old-videos folder.
-
-            Shows previously completed or archived projects with:
-            - Project ID and topic
-            - Archive date
-            - Files included
-
-            Use this to review past work or restore a project.""",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+@functools.lru_cache(maxsize=32)
+def _parse_script(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
-    """Handle tool calls."""
-
-    if name == "create_script":
-        result = await create_lds_script(
-            topic=arguments.get("topic"),
-            topic_context=arguments.get("topic_context", ""),
-            hook_question=arguments.get("hook_question", ""),
-            duration_seconds=arguments.get("duration_seconds", 60),
-            characters=CHARACTERS
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "search_lds_content":
-        result = await search_lds_content(
-            query=arguments.get("query"),
-            source_type=arguments.get("source_type", "all"),
-            max_results=arguments.get("max_results", 5)
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "search_world_news":
-        result = await search_world_news(
-            topic=arguments.get("topic"),
-            find_gospel_connection=arguments.get("find_gospel_connection", True)
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+def _load_script_cached(script_path: Path) -> dict | None:
+    """
+    Load a saved script, re-parsing only when the file has changed.
 
-    elif name == "verify_quote":
-        result = await verify_lds_quote(
-            quote=arguments.get("quote"),
-            attributed_to=arguments.get("attributed_to"),
-            source=arguments.get("source", "")
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    One stat both checks that the script exists (None if not) and keys the
+    cache on (path, mtime_ns, size), so an edited or re-saved script is
+    picked up on the next call. The returned dict is shared between calls:
+    don't mutate it.
+    """
+    try:
+        st = os.stat(script_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _parse_script(os.fspath(script_path), st.st_mtime_ns, st.st_size)
 
-    elif name == "upload_images":
-        manager = ImageManager(SHORTS_DIR / "images")
-        result = await manager.register_images(
-            image_descriptions=arguments.get("image_descriptions", []),
-            script_id=arguments.get("script_id")
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-    elif name == "generate_audio":
-        script_id = arguments.get("script_id")
-        script_json = arguments.get("script_json")
+# next_steps prefixes; the project id and closing quote are appended per call
+_STEP_GEN_AUDIO = "Generate audio: use generate_audio with script_id='"
+_STEP_RENDER = "Render video: use render_short with script_id='"
+_STEP_RENDER_DIRECT = "Or render directly: use render_short with script_id='"
 
-        pm = get_project_manager(DATA_DIR.parent)
 
-        # Try to load script from file if script_id provided
-        if script_id:
-            script_path = SHORTS_DIR / "scripts" / f"{script_id}.json"
-            if script_path.exists():
-                with open(script_path) as f:
-                    script_json = json.load(f)
-            # Set as current project
-            pm.set_current_project(script_id)
+async def _publish_legacy(src: Path, dst: Path) -> None:
+    """
+    Publish a copy of src at dst, in a worker thread (multi-MB MP3).
 
-        if not script_json:
-            return [TextContent(type="text", text="Error: No script provided or found")]
+    Never a hard link: the legacy CLI rewrites dst in place, which would
+    clobber the project's file through the shared inode. The copy lands
+    in a temp file that replaces dst, so an older dst (even one still
+    linked to src) is swapped out rather than truncated.
+    """
+    await asyncio.to_thread(_copy_replace, src, dst)
 
-        # Extract script_id from JSON if not provided
-        if not script_id:
-            script_content = script_json.get("script", script_json)
-            script_id = script_content.get("id")
 
-            # If still no ID, generate one and save the script
-            if not script_id:
-                script_id = pm.generate_project_id()
-                script_json["script"] = script_json.get("script", {})
-                script_json["script"]["id"] = script_id
-                pm.save_script(script_json, script_id)
+def _copy_replace(src: Path, dst: Path) -> None:
+    # A fresh temp name per publish: concurrent generate_audio calls for
+    # different projects all publish to the same legacy dst
+    fd, tmp = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
 
-        # Get paths from ProjectManager
-        paths = pm.get_paths(script_id)
 
-        # Ensure directories exist
-        paths.audio_file.parent.mkdir(parents=True, exist_ok=True)
+def _dump(payload, pretty: bool = False) -> str:
+    """
+    Serialize a tool result.
 
-        dialogue = script_json.get("script", {}).get("dialogue", [])
+    Compact by default: the consumer is the MCP client, not a person. Pass
+    pretty=True for the few results people read as-is (project status,
+    save confirmation); the polled render tools stay compact.
+    """
+    # default=str covers Path values and other odd objects in tool results;
+    # non-string keys (e.g. int-keyed maps) are stringified as json.dumps did
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if pretty else orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(payload, default=str, option=option).decode()
+
+
+def _dump_textcontent(payload, pretty: bool = False) -> TextContent:
+    """A tool result as the TextContent item handlers return."""
+    return TextContent(type="text", text=_dump(payload, pretty))
+
+
+# Fixed replies, serialized once at import. The path-bearing ones keep a
+# __PATH__ slot that _path_reply fills with the JSON-escaped path.
+_REPLY_SCRIPT_ID_REQUIRED = _dump_textcontent({
+    "status": "error",
+    "message": "script_id is required"
+})
+_REPLY_JOB_ID_REQUIRED = _dump_textcontent({
+    "status": "error",
+    "message": "job_id is required"
+})
+_REPLY_CONFIRM_CLEANUP = _dump_textcontent({
+    "status": "confirmation_required",
+    "message": "This will remove all project files. Set confirm=true to proceed.",
+    "warning": "All files in data/shorts/ will be deleted (archived first if archive_first=true)"
+})
+_TMPL_SCRIPT_NOT_FOUND = _dump({
+    "status": "error",
+    "message": "Script not found: __PATH__",
+    "action_required": "Create a script first using create_script or save_script"
+})
+_TMPL_AUDIO_NOT_FOUND = _dump({
+    "status": "error",
+    "message": "Audio not found: __PATH__",
+    "action_required": "Generate audio first using generate_audio"
+})
+
+
+def _path_reply(template: str, path) -> TextContent:
+    escaped = orjson.dumps(os.fspath(path)).decode()[1:-1]  # Backslashes, quotes
+    return TextContent(type="text", text=template.replace("__PATH__", escaped))
+
+
+def _schema(properties: dict | None = None, required: list | None = None) -> dict:
+    """JSON schema for a tool's object-typed arguments."""
+    return {
+        "type": "object",
+        "properties": properties or {},
+        "required": required or []
+    }
 
-        # If dialogue is empty, try top-level
-        if not dialogue and isinstance(script_json.get("dialogue"), list):
-            dialogue = script_json.get("dialogue", [])
 
-        if not dialogue:
-            return [TextContent(type="text", text="Error: No dialogue found in script")]
+def _prop(type_: str, description: str, **extra) -> dict:
+    """One property of a tool's input schema."""
+    return {"type": type_, "description": description, **extra}
+
+
+_string = functools.partial(_prop, "string")
+_integer = functools.partial(_prop, "integer")
+_boolean = functools.partial(_prop, "boolean")
+_object = functools.partial(_prop, "object")
+_array = functools.partial(_prop, "array")  # Pass items=<item schema>
+_STRING = {"type": "string"}  # Array items and other undescribed strings
+
+
+# Argument fields shared by several tools
+_RENDER_SCRIPT_ID = _string("ID of the script to render")
+_HOOK_TEXT = _string("Text to display at top of video (3-5 words)")
+_OPENING_IMAGE = _string("Path to opening/thumbnail image (optional)")
+_OUTPUT_FILENAME = _string("Output filename (without extension)", default="short_video")
+
+
+# The tool list is static: build (and validate) the Tool models once at import
+_TOOLS_CACHE = (
+    Tool(
+        name="create_script",
+        description="""Create a short-form video script (1-2 minutes) for LDS content.
+
+        The script features two characters:
+        - Sister Faith: Knowledgeable member who cites prophets, scriptures, testimonies
+        - Brother Marcus: Curious member learning about doctrine
+
+        Returns a JSON script ready for audio generation.""",
+        inputSchema=_schema({
+            "topic": _string("The main topic (e.g., 'The First Vision', 'Faith in Jesus Christ')"),
+            "topic_context": _string("Additional context, scriptures, or prophet quotes to include"),
+            "hook_question": _string("A compelling question or phrase for the video overlay (3-5 words)"),
+            "duration_seconds": _integer("Target duration in seconds (60-120 recommended)", default=60)
+        }, required=["topic"])
+    ),
+    Tool(
+        name="search_lds_content",
+        description="""Search for LDS scriptures, prophet quotes, and church content.
+
+        Sources:
+        - Book of Mormon, Doctrine & Covenants, Pearl of Great Price
+        - General Conference talks
+        - Liahona magazine
+        - Church news and official statements
+
+        Returns verified quotes with sources.""",
+        inputSchema=_schema({
+            "query": _string("Search query (e.g., 'faith', 'Joseph Smith First Vision')"),
+            "source_type": _string(
+                "Type of source to search",
+                enum=["scriptures", "conference", "liahona", "all"],
+                default="all"
+            ),
+            "max_results": _integer("Maximum number of results", default=5)
+        }, required=["query"])
+    ),
+    Tool(
+        name="search_world_news",
+        description="""Search for recent world news and find relevant LDS teachings.
+
+        Helps create content that connects current events with gospel principles.
+        Returns news summaries with suggested scripture/prophet connections.""",
+        inputSchema=_schema({
+            "topic": _string("News topic to search (e.g., 'peace', 'hope', 'family')"),
+            "find_gospel_connection": _boolean("Whether to suggest related gospel teachings", default=True)
+        }, required=["topic"])
+    ),
+    Tool(
+        name="verify_quote",
+        description="""Verify if a prophet quote or scripture reference is accurate.
+
+        IMPORTANT: Always use this before including quotes in scripts to avoid misinformation.
+        Returns verification status and correct citation if found.""",
+        inputSchema=_schema({
+            "quote": _string("The quote text to verify"),
+            "attributed_to": _string("Who the quote is attributed to (e.g., 'President Nelson', 'Moroni')"),
+            "source": _string("Optional: claimed source (e.g., 'October 2023 Conference')")
+        }, required=["quote", "attributed_to"])
+    ),
+    Tool(
+        name="upload_images",
+        description="""Register manually uploaded images for video assembly.
+
+        Upload images to be used in the video. The system will intelligently
+        order them based on the script content.
+
+        Images should be placed in: data/shorts/images/
+        Returns a list of registered images with suggested placements.""",
+        inputSchema=_schema({
+            "image_descriptions": _array(
+                "List of images with descriptions for intelligent ordering",
+                items={
+                    "type": "object",
+                    "properties": {
+                        "filename": _STRING,
+                        "description": _STRING
+                    }
+                }
+            ),
+            "script_id": _string("ID of the script to associate images with")
+        }, required=["image_descriptions"])
+    ),
+    Tool(
+        name="generate_audio",
+        description="""Generate audio from a script using ElevenLabs voices.
+
+        Uses:
+        - Sister Faith: Eve voice (professional, calm)
+        - Brother Marcus: Charles voice (young, curious)
+
+        Returns path to generated audio file.""",
+        inputSchema=_schema({
+            "script_id": _string("ID of the script to generate audio for"),
+            "script_json": _object("Alternatively, pass the script JSON directly")
+        })
+    ),
+    Tool(
+        name="validate_render",
+        description="""IMPORTANT: Call this BEFORE execute_render to catch issues early!
+
+        Validates all render prerequisites to avoid wasted render time:
+        - Character images exist (correct format/extension)
+        - Visual assets/floating images can be found
+        - Script structure is valid
+        - Audio and timestamps exist
+
+        Returns a detailed validation report with:
+        - errors: Issues that MUST be fixed before rendering
+        - warnings: Issues that may affect quality but won't stop render
+        - info: Helpful information about what was found
+
+        ALWAYS call this before execute_render to save time!""",
+        inputSchema=_schema({
+            "script_id": _string("ID of the script to validate")
+        }, required=["script_id"])
+    ),
+    Tool(
+        name="render_short",
+        description="""Prepare a short-form video render plan (9:16 vertical format).
+
+        Validates all prerequisites and prepares the render configuration.
+        Use execute_render to actually render the video.
+
+        Output: Render plan ready for execution""",
+        inputSchema=_schema({
+            "script_id": _RENDER_SCRIPT_ID,
+            "hook_text": _HOOK_TEXT,
+            "opening_image": _OPENING_IMAGE,
+            "output_filename": _OUTPUT_FILENAME
+        }, required=["script_id", "hook_text"])
+    ),
+    Tool(
+        name="execute_render",
+        description="""Execute the video render and create the final MP4 file.
+
+        This tool ACTUALLY renders the video using FFmpeg/PyAV.
+        It creates the final short-form video (9:16 vertical, 1080x1920).
+
+        Assembles:
+        - Opening image/thumbnail with fade
+        - Hook text overlay (top of video)
+        - Character poses with lip sync
+        - Audio narration
+        - Word-by-word captions
+
+        Output: Final MP4 file ready for TikTok/Instagram Reels/YouTube Shorts
+
+        NOTE: This may take 1-5 minutes depending on video length.""",
+        inputSchema=_schema({
+            "script_id": _RENDER_SCRIPT_ID,
+            "hook_text": _HOOK_TEXT,
+            "opening_image": _OPENING_IMAGE,
+            "output_filename": _OUTPUT_FILENAME
+        }, required=["script_id", "hook_text"])
+    ),
+    Tool(
+        name="get_render_log",
+        description="""Get the render log file content to see what happened during rendering.
+
+        Use this tool AFTER calling execute_render to see:
+        - What step the render is on
+        - Any errors that occurred
+        - Progress information
+
+        This is essential for debugging render issues.""",
+        inputSchema=_schema({
+            "tail_lines": _integer("Number of lines from end to return (default: 100)", default=100)
+        })
+    ),
+    Tool(
+        name="check_render_status",
+        description="""Check the current status of a background render.
+
+        Returns:
+        - phase: current phase (starting, importing, rendering, complete, error)
+        - message: human-readable status message
+        - progress: percentage complete (0-100)
+        - last_updated: when status was last updated
+        - logs: last 20 lines from render log
+
+        Use this to monitor render progress in real-time.""",
+        inputSchema=_schema({
+            "script_id": _string("ID of the script being rendered (optional)")
+        })
+    ),
+    Tool(
+        name="stop_render",
+        description="""Stop a running render process.
+
+        Use this if:
+        - Render is taking too long
+        - You need to make changes and re-render
+        - Something went wrong
+
+        Requires the PID from execute_render or check_render_status.""",
+        inputSchema=_schema({
+            "pid": _integer("Process ID of the render worker to stop"),
+            "force": _boolean("Force kill (SIGKILL) instead of graceful stop", default=False)
+        }, required=["pid"])
+    ),
+    Tool(
+        name="list_projects",
+        description="""List all current short video projects and their status.""",
+        inputSchema=_schema()
+    ),
+    Tool(
+        name="get_project_status",
+        description="""Get detailed status of a specific project.
+
+        Pass project_ids instead to check several projects in one call
+        (returns which files exist for each).""",
+        inputSchema=_schema({
+            "project_id": _string("Project ID to check"),
+            "project_ids": _array("Several project IDs to check at once", items=_STRING)
+        })
+    ),
+    Tool(
+        name="save_script",
+        description="""Save a generated script to the project.
+
+        IMPORTANT: Call this after generating a script JSON to save it to disk.
+        This ensures the script is available for audio generation and rendering.
+
+        The script will be:
+        1. Saved to data/shorts/scripts/{project_id}.json
+        2. Also saved to data/production_plan.json for CLI compatibility
+        3. Set as the current active project
+
+        Returns the project_id for subsequent operations.""",
+        inputSchema=_schema({
+            "script_json": _object("The complete script JSON object to save"),
+            "project_id": _string("Optional: Override the project ID (defaults to script.id or auto-generated)")
+        }, required=["script_json"])
+    ),
+    Tool(
+        name="manage_files",
+        description="""Manage files within the project (copy, move, list, register images).
+
+        Operations:
+        - copy: Copy a file from any location to the project
+        - move: Move a file within the project
+        - register_images: Copy multiple images to a project's images folder
+        - list: List directory contents
+        - list_project_images: List images registered for a project
+        - mkdir: Create a directory
+        - delete: Delete a file (requires confirm=true)
+
+        Use this to:
+        - Copy images from Downloads or other folders to the project
+        - Organize project files
+        - List available images""",
+        inputSchema=_schema({
+            "operation": _string(
+                "The file operation to perform",
+                enum=["copy", "move", "register_images", "list", "list_project_images", "mkdir", "delete"]
+            ),
+            "source": _string("Source file path (for copy/move)"),
+            "destination": _string("Destination path (for copy/move)"),
+            "path": _string("Directory path (for list/mkdir/delete)"),
+            "image_paths": _array("List of image paths (for register_images)", items=_STRING),
+            "project_id": _string("Project ID (for register_images/list_project_images)"),
+            "pattern": _string("Glob pattern for filtering (for list)", default="*"),
+            "overwrite": _boolean("Overwrite existing files", default=False),
+            "confirm": _boolean("Confirm deletion (required for delete)", default=False)
+        }, required=["operation"])
+    ),
+    Tool(
+        name="workflow",
+        description="""High-level workflow operations for streamlined video creation.
+
+        Operations:
+        - create_project: Initialize a new video project with topic
+        - finalize_script: Validate and save a generated script JSON
+        - produce_video: Check prerequisites and prepare for rendering
+        - get_summary: Get actionable project status
+
+        RECOMMENDED FLOW:
+        1. workflow(operation="create_project", topic="Your Topic")
+        2. [Generate script JSON based on instructions]
+        3. workflow(operation="finalize_script", script_json={...})
+        4. generate_audio(script_id="...")
+        5. render_short(script_id="...", hook_text="...")
+
+        This tool provides clearer guidance at each step.""",
+        inputSchema=_schema({
+            "operation": _string(
+                "The workflow operation to perform",
+                enum=["create_project", "finalize_script", "produce_video", "get_summary"]
+            ),
+            "topic": _string("Video topic (for create_project)"),
+            "topic_context": _string("Additional context, quotes, scriptures (for create_project)"),
+            "hook_question": _string("Catchy question for video overlay (for create_project)"),
+            "duration_seconds": _integer("Target video duration (for create_project)", default=75),
+            "script_json": _object("The generated script JSON (for finalize_script)"),
+            "project_id": _string("Project ID (optional, uses current project if not specified)")
+        }, required=["operation"])
+    ),
+    Tool(
+        name="get_status",
+        description="""Get current project status and phase.
+
+        CALL THIS FIRST when starting a new chat to understand:
+        - What project is active (if any)
+        - What phase we're in (idea, script, audio, render, complete)
+        - What files exist
+        - What the next steps are
+
+        This helps avoid confusion and conflicts between projects.""",
+        inputSchema=_schema()
+    ),
+    Tool(
+        name="archive_project",
+        description="""Archive the current project to old-videos folder.
+
+        Use this when:
+        - A video is complete and you want to start fresh
+        - You want to clean up before a new project
+        - There are leftover files from a previous project
+
+        Archives all project files (script, audio, timestamps, video) to:
+        old-videos/{project_id}_{timestamp}/
+
+        After archiving, the system is ready for a new project.""",
+        inputSchema=_schema({
+            "delete_source": _boolean("Delete source files after archiving (default: true)", default=True),
+            "project_id": _string("Project ID to archive (uses current if not specified)")
+        })
+    ),
+    Tool(
+        name="cleanup_workspace",
+        description="""Clean up all project files to start completely fresh.
+
+        This will:
+        1. Archive the current project (if any)
+        2. Remove all files from data/shorts/
+        3. Reset project state
+
+        Use with caution - this removes all current project data.""",
+        inputSchema=_schema({
+            "archive_first": _boolean("Archive current project before cleanup (default: true)", default=True),
+            "confirm": _boolean("Confirm cleanup action (required)", default=False)
+        }, required=["confirm"])
+    ),
+    Tool(
+        name="list_archived",
+        description="""List all archived projects in old-videos folder.
+
+        Shows previously completed or archived projects with:
+        - Project ID and topic
+        - Archive date
+        - Files included
+
+        Use this to review past work or restore a project.""",
+        inputSchema=_schema()
+    ),
+    Tool(
+        name="poll_job",
+        description="""Check on a background render started by execute_render.
+
+        Pass the job_id returned by execute_render. Returns "running" with the
+        current phase and progress while the worker is busy, then "completed"
+        or "failed" with the final render result once it exits.
+
+        Poll every 30-60 seconds; use get_render_log for detailed progress.""",
+        inputSchema=_schema({
+            "job_id": _string("The job_id returned by execute_render")
+        }, required=["job_id"])
+    ),
+    Tool(
+        name="batch_execute",
+        description="""Run several independent tool calls in one request.
+
+        Operations run concurrently (up to max_concurrent at a time), so only
+        batch calls that don't depend on each other's results, e.g. several
+        searches and quote verifications, or status checks for many projects.
+
+        Returns each operation's parsed result and any errors, by index.""",
+        inputSchema=_schema({
+            "operations": _array("Tool calls to run", items=_schema({
+                "tool": _string("Name of the tool to call"),
+                "arguments": _object("Arguments for that tool")
+            }, required=["tool"])),
+            "max_concurrent": _integer("Maximum operations running at once", default=4),
+            "stop_on_error": _boolean("Cancel the remaining operations after the first failure", default=False)
+        }, required=["operations"])
+    )
+)
 
-        # Generate audio with correct voice mapping
-        result = generate_audio_from_script(
-            dialogue=dialogue,
-            output_file=str(paths.audio_file),
-            voice_id_skeptic=CHARACTERS["skeptic"]["voice_id"],
-            voice_id_analyst=CHARACTERS["analyst"]["voice_id"]
-        )
 
-        # Create legacy copy for CLI compatibility
-        try:
-            import shutil
-            paths.legacy_audio.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(paths.audio_file, paths.legacy_audio)
-        except Exception as e:
-            print(f"Warning: Could not create legacy audio copy: {e}")
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available MCP tools."""
+    return list(_TOOLS_CACHE)
+
+
+# Tool name -> handler coroutine, filled in by @_tool_handler below.
+# call_tool dispatches with a single dict lookup.
+_TOOL_HANDLERS: dict = {}
+
+
+def _tool_handler(name: str):
+    """Register a coroutine as the handler for an MCP tool."""
+    def register(handler):
+        _TOOL_HANDLERS[name] = handler
+        return handler
+    return register
+
+
+@_tool_handler("create_script")
+async def _handle_create_script(arguments: dict) -> list[TextContent | ImageContent]:
+    result = await create_lds_script(
+        topic=arguments.get("topic"),
+        topic_context=arguments.get("topic_context", ""),
+        hook_question=arguments.get("hook_question", ""),
+        duration_seconds=arguments.get("duration_seconds", 60),
+        characters=CHARACTERS
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("search_lds_content")
+async def _handle_search_lds_content(arguments: dict) -> list[TextContent | ImageContent]:
+    result = await search_lds_content(
+        query=arguments.get("query"),
+        source_type=arguments.get("source_type", "all"),
+        max_results=arguments.get("max_results", 5)
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("search_world_news")
+async def _handle_search_world_news(arguments: dict) -> list[TextContent | ImageContent]:
+    result = await search_world_news(
+        topic=arguments.get("topic"),
+        find_gospel_connection=arguments.get("find_gospel_connection", True)
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("verify_quote")
+async def _handle_verify_quote(arguments: dict) -> list[TextContent | ImageContent]:
+    result = await verify_lds_quote(
+        quote=arguments.get("quote"),
+        attributed_to=arguments.get("attributed_to"),
+        source=arguments.get("source", "")
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("upload_images")
+async def _handle_upload_images(arguments: dict) -> list[TextContent | ImageContent]:
+    manager = _image_manager()
+    result = await manager.register_images(
+        image_descriptions=arguments.get("image_descriptions", []),
+        script_id=arguments.get("script_id")
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("generate_audio")
+async def _handle_generate_audio(arguments: dict) -> list[TextContent | ImageContent]:
+    script_id = arguments.get("script_id")
+    script_json = arguments.get("script_json")
+
+    pm = _PM
+
+    # Try to load script from file if script_id provided
+    if script_id:
+        saved = await asyncio.to_thread(_load_script_cached, _script_path(script_id))
+        if saved is not None:
+            script_json = saved
+        # Set as current project
+        pm.set_current_project(script_id)
 
-        response = {
-            "status": "success",
-            "project_id": script_id,
-            "audio_file": str(paths.audio_file),
-            "legacy_copy": str(paths.legacy_audio),
-            "message": result,
-            "next_steps": [
-                f"Render video: use render_short with script_id='{script_id}'",
-                "Timestamps will be auto-generated during render"
-            ]
-        }
+    if not script_json:
+        return [TextContent(type="text", text="Error: No script provided or found")]
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    # The script body is either nested under "script" or the object itself
+    body = script_json.get("script")
+    if not isinstance(body, dict):
+        body = script_json
 
-    elif name == "validate_render":
-        # Import the validation function
-        from lds_mcp.tools.short_renderer import validate_render_prerequisites
+    # Extract script_id from JSON if not provided
+    if not script_id:
+        script_id = body.get("id")
 
-        script_id = arguments.get("script_id")
+        # If still no ID, generate one and save the script
         if not script_id:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "message": "script_id is required"
-            }, indent=2))]
-
-        # Run validation
-        validation = validate_render_prerequisites(
-            script_id=script_id,
-            shorts_dir=SHORTS_DIR,
-            base_dir=DATA_DIR.parent
-        )
+            script_id = pm.generate_project_id()
+            script_json["script"] = script_json.get("script", {})
+            script_json["script"]["id"] = script_id
+            await _run_fs(pm.save_script, script_json, script_id)
+
+    # Get paths from ProjectManager
+    paths = _project_paths(script_id)
+
+    # Ensure directories exist
+    _ensure_dir(paths.audio_file.parent)
+
+    dialogue = body.get("dialogue")
+
+    # If dialogue is empty, try top-level
+    if not dialogue and body is not script_json:
+        dialogue = script_json.get("dialogue")
+
+    if not dialogue or not isinstance(dialogue, list):
+        return [TextContent(type="text", text="Error: No dialogue found in script")]
+
+    from src.core.elevenlabs import generate_audio_from_script
+
+    # Generate audio with correct voice mapping. This is minutes of blocking
+    # HTTP, so run it on a worker thread and keep serving status polls.
+    result = await asyncio.to_thread(
+        generate_audio_from_script,
+        dialogue=dialogue,
+        output_file=paths.audio_file_str,
+        voice_id_skeptic=VOICE_ID_SKEPTIC,
+        voice_id_analyst=VOICE_ID_ANALYST
+    )
+    _invalidate_status(script_id)  # The project now has audio
+
+    # Create legacy copy for CLI compatibility
+    try:
+        _ensure_dir(paths.legacy_audio.parent)
+        await _publish_legacy(paths.audio_file, paths.legacy_audio)
+    except Exception as e:
+        logger.warning("Could not create legacy audio copy: %s", e)
+
+    response = {
+        "status": "success",
+        "project_id": script_id,
+        "audio_file": paths.audio_file_str,
+        "legacy_copy": paths.legacy_audio_str,
+        "message": result,
+        "next_steps": [
+            _STEP_RENDER + str(script_id) + "'",
+            "Timestamps will be auto-generated during render"
+        ]
+    }
 
-        # Format response with clear action items
-        response = {
-            "status": "valid" if validation["valid"] else "invalid",
-            "can_render": validation["valid"],
-            "summary": validation["summary"],
-            "script_id": script_id,
-            "details": {
-                "errors": validation.get("errors", []),
-                "warnings": validation.get("warnings", []),
-                "info": validation.get("info", [])
-            }
+    return [_dump_textcontent(response)]
+
+
+@_tool_handler("validate_render")
+async def _handle_validate_render(arguments: dict) -> list[TextContent | ImageContent]:
+    # Import the validation function
+    from lds_mcp.tools.short_renderer import validate_render_prerequisites
+
+    script_id = arguments.get("script_id")
+    if not script_id:
+        return [_REPLY_SCRIPT_ID_REQUIRED]
+
+    # Run validation
+    validation = validate_render_prerequisites(
+        script_id=script_id,
+        shorts_dir=SHORTS_DIR,
+        base_dir=_DATA_PARENT
+    )
+
+    # Format response with clear action items
+    response = {
+        "status": "valid" if validation["valid"] else "invalid",
+        "can_render": validation["valid"],
+        "summary": validation["summary"],
+        "script_id": script_id,
+        "details": {
+            "errors": validation.get("errors", []),
+            "warnings": validation.get("warnings", []),
+            "info": validation.get("info", [])
         }
+    }
 
-        if not validation["valid"]:
-            response["action_required"] = "Fix the errors listed above before calling execute_render"
-        elif validation.get("warnings"):
-            response["note"] = f"Ready to render, but {len(validation['warnings'])} warning(s) found. Review warnings."
+    if not validation["valid"]:
+        response["action_required"] = "Fix the errors listed above before calling execute_render"
+    elif validation.get("warnings"):
+        response["note"] = f"Ready to render, but {len(validation['warnings'])} warning(s) found. Review warnings."
+    else:
+        response["note"] = "All checks passed! You can proceed with execute_render."
+
+    return [_dump_textcontent(response)]
+
+
+@_tool_handler("render_short")
+async def _handle_render_short(arguments: dict) -> list[TextContent | ImageContent]:
+    script_id = arguments.get("script_id")
+
+    # Set as current project
+    pm = _PM
+    if script_id:
+        pm.set_current_project(script_id)
+
+    from lds_mcp.tools.short_renderer import render_short_video
+
+    result = await render_short_video(
+        script_id=script_id,
+        hook_text=arguments.get("hook_text"),
+        opening_image=arguments.get("opening_image"),
+        output_filename=arguments.get("output_filename", script_id or "short_video"),
+        shorts_dir=SHORTS_DIR,
+        auto_generate_timestamps=True  # Auto-generate if missing
+    )
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("execute_render")
+async def _handle_execute_render(arguments: dict) -> list[TextContent | ImageContent]:
+    # IMPORTANT: Reload render modules to pick up any code changes
+    # This avoids needing to restart Claude Desktop after modifying short_renderer.py
+    reload_render_modules()
+    await _reap_jobs(time.monotonic())  # Settle finished workers nobody polled
+
+    logger.debug("execute_render arguments: %s", arguments)
+
+    script_id = arguments.get("script_id")
+    hook_text = arguments.get("hook_text", "")
+    opening_image = arguments.get("opening_image", "")
+    output_filename = arguments.get("output_filename", script_id or "short_video")
+
+    logger.info("execute_render script_id=%s hook_text=%s", script_id, hook_text)
+
+    if not script_id:
+        return [_REPLY_SCRIPT_ID_REQUIRED]
+
+    # Set as current project
+    pm = _PM
+    pm.set_current_project(script_id)
+
+    # Validate prerequisites BEFORE starting render (one stat each, on cached str paths)
+    paths = _project_paths(script_id)
+    script_path = paths.script_file_str
+    audio_path = paths.audio_file_str
+
+    if not os.path.isfile(script_path):
+        return [_path_reply(_TMPL_SCRIPT_NOT_FOUND, script_path)]
+
+    if not os.path.isfile(audio_path):
+        return [_path_reply(_TMPL_AUDIO_NOT_FOUND, audio_path)]
+
+    # Initialize status file
+    status_file = _STATUS_FILE
+    _ensure_dir(status_file.parent)
+    write_status_atomic(status_file, {
+        "phase": "starting",
+        "message": "Launching render process...",
+        "progress": 0,
+        "script_id": script_id,
+        "started_at": iso_now()
+    })
+
+    # Launch render worker as separate process
+    # This ensures render continues even if MCP client disconnects
+    worker_log = _WORKER_LOG
+
+    try:
+        # Build command
+        cmd = [
+            _PY_EXEC,
+            _WORKER_SCRIPT,
+            script_id,
+            hook_text,
+            opening_image or "",
+            output_filename
+        ]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Launching worker: %s", " ".join(cmd))
+
+        # Launch detached process (continues after MCP disconnects)
+        # On Windows, use CREATE_NEW_PROCESS_GROUP and DETACHED_PROCESS
+        if sys.platform == "win32":
+            DETACHED_PROCESS = 0x00000008
+            CREATE_NEW_PROCESS_GROUP = 0x00000200
+            with open(worker_log, "w") as log_f:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=log_f,
+                    stderr=subprocess.STDOUT,
+                    creationflags=DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP,
+                    close_fds=True
+                )
         else:
-            response["note"] = "All checks passed! You can proceed with execute_render."
-
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-    elif name == "render_short":
-        script_id = arguments.get("script_id")
+            # Unix: use nohup-like approach
+            with open(worker_log, "w") as log_f:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=log_f,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                    close_fds=True
+                )
 
-        # Set as current project
-        pm = get_project_manager(DATA_DIR.parent)
-        if script_id:
-            pm.set_current_project(script_id)
-
-        result = await render_short_video(
-            script_id=script_id,
-            hook_text=arguments.get("hook_text"),
-            opening_image=arguments.get("opening_image"),
-            output_filename=arguments.get("output_filename", script_id or "short_video"),
-            shorts_dir=SHORTS_DIR,
-            auto_generate_timestamps=True  # Auto-generate if missing
-        )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        launched_at = time.time()
+
+        # Watch the worker briefly so a crash on startup (bad interpreter,
+        # import error) is reported now; stop early once it reports in.
+        # Sleeps are async so other tool calls keep being served meanwhile.
+        deadline = time.monotonic() + _WORKER_STARTUP_GRACE
+        while process.poll() is None and time.monotonic() < deadline:
+            await asyncio.sleep(_WORKER_STARTUP_POLL)
+            current_status = _read_json_file(status_file)
+            if current_status and current_status.get("phase") == "worker_started":
+                break
+
+        # Check if process is still running (poll() returns None if running)
+        process_running = process.poll() is None
+
+        if process_running:
+            job_id = uuid.uuid4().hex
+            _JOBS[job_id] = {
+                "process": process,
+                "script_id": script_id,
+                "output_filename": output_filename,
+                "started_at": launched_at
+            }
+            result = {
+                "status": "render_running",
+                "message": f"Video render is now running in background (PID: {process.pid}). This will take several minutes.",
+                "job_id": job_id,
+                "script_id": script_id,
+                "pid": process.pid,
+                "process_verified": True,
+                "status_file": str(status_file),
+                "worker_log": worker_log,
+                "output_location": f"data/shorts/output/{output_filename}.mp4",
+                "important": f"The render IS running. Use poll_job with job_id='{job_id}' to monitor progress.",
+                "instructions": [
+                    "1. Render is CONFIRMED running in background",
+                    f"2. Use poll_job with job_id='{job_id}' for progress and the final result (check_render_status for logs)",
+                    "3. You can close this chat - render will continue",
+                    f"4. Final video will be at: data/shorts/output/{output_filename}.mp4",
+                    f"5. To stop render if needed: kill process {process.pid}"
+                ]
+            }
+        else:
+            # Process exited immediately - check for error
+            result = {
+                "status": "error",
+                "message": "Render process exited immediately. Check worker log for details.",
+                "script_id": script_id,
+                "exit_code": process.returncode,
+                "worker_log": worker_log,
+                "hint": "Try running manually: python lds_mcp/tools/render_worker.py ..."
+            }
+            try:
+                result["worker_log_tail"] = "".join(_tail_file(worker_log, 20))
+            except OSError:
+                pass
 
-    elif name == "execute_render":
-        # IMPORTANT: Reload render modules to pick up any code changes
-        # This avoids needing to restart Claude Desktop after modifying short_renderer.py
-        reload_render_modules()
+        return [_dump_textcontent(result)]
 
-        print(f"[MCP_SERVER] execute_render called", file=sys.stderr, flush=True)
-        print(f"[MCP_SERVER] arguments: {arguments}", file=sys.stderr, flush=True)
+    except Exception as e:
+        error_tb = traceback.format_exc()
+        logger.error("Failed to launch worker: %s", e)
+        error_result = {
+            "status": "error",
+            "message": f"Failed to launch render worker: {str(e)}",
+            "traceback": error_tb
+        }
+        return [_dump_textcontent(error_result)]
+
+
+def _read_json(path: Path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _read_json_file(path: Path):
+    """_read_json, but None if the file is missing or not valid JSON."""
+    try:
+        return _read_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _tail_file(path: Path, n: int, block: int = 8192) -> list[str]:
+    """Return the last n lines of a text file, reading only as much of its end as needed."""
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # n + 1 newlines guarantee n complete lines even when the file ends with one
+        while pos > 0 and newlines <= n:
+            read = min(block, pos)
+            pos -= read
+            f.seek(pos)
+            chunk = f.read(read)
+            newlines += chunk.count(b"\n")  # Count each block once, not the growing buffer
+            blocks.append(chunk)
+    blocks.reverse()
+    text = b"".join(blocks).decode("utf-8", "replace").replace("\r\n", "\n")
+    return text.splitlines(keepends=True)[-n:]
+
+
+# Longest tail get_render_log can serve from memory; longer requests read the file
+_LOG_TAIL_MAX = 1000
+# How long a refreshed snapshot is trusted before the files are stat'ed again
+_RENDER_FILES_TTL = 0.5
+
+
+@dataclass
+class _StatusCache:
+    """
+    Last parsed render status and render log tail.
 
-        script_id = arguments.get("script_id")
-        hook_text = arguments.get("hook_text", "")
-        opening_image = arguments.get("opening_image", "")
-        output_filename = arguments.get("output_filename", script_id or "short_video")
+    Clients poll check_render_status and get_render_log while a render
+    runs. A refresh stats both files and re-reads the status only when its
+    (mtime_ns, size) changed; the log is read incrementally from the last
+    offset, so each poll costs O(new bytes) instead of O(log size).
+    """
+    status_dict: dict | None = None
+    status_error: str | None = None
+    status_key: tuple | None = None
+    log_exists: bool = False
+    log_tail: deque = field(default_factory=lambda: deque(maxlen=_LOG_TAIL_MAX))
+    log_lines: int = 0  # Complete lines seen so far
+    log_partial: bytes = b""  # Last line, until its newline arrives
+    log_offset: int = 0
+    log_head: bytes = b""  # First bytes, to notice the log being rewritten
+    last_checked: float = float("-inf")
+    reply: tuple | None = None  # (fingerprint, check_render_status reply)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def refresh(self) -> None:
+        async with self.lock:
+            now = time.monotonic()
+            if now - self.last_checked < _RENDER_FILES_TTL:
+                return
+            await asyncio.to_thread(self._refresh_files)
+            self.last_checked = time.monotonic()
+
+    def _refresh_files(self) -> None:
+        self._refresh_status()
+        self._refresh_log()
+
+    def _refresh_status(self) -> None:
+        try:
+            st = os.stat(_STATUS_FILE)
+        except OSError:
+            self.status_dict = self.status_error = self.status_key = None
+            return
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self.status_key:
+            return
+        self.status_key = key
+        try:
+            self.status_dict, self.status_error = _read_json(_STATUS_FILE), None
+        except Exception as e:
+            self.status_dict, self.status_error = None, str(e)
 
-        print(f"[MCP_SERVER] script_id={script_id}, hook_text={hook_text}", file=sys.stderr, flush=True)
+    def _reset_log(self) -> None:
+        self.log_tail.clear()
+        self.log_lines = 0
+        self.log_partial = self.log_head = b""
+        self.log_offset = 0
 
-        # Set as current project
-        pm = get_project_manager(DATA_DIR.parent)
-        if script_id:
-            pm.set_current_project(script_id)
+    def _refresh_log(self) -> None:
+        try:
+            f = open(_LOG_FILE, "rb")
+        except OSError:
+            self.log_exists = False
+            self._reset_log()
+            return
+        self.log_exists = True
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            # The worker truncates the log for each render
+            if size < self.log_offset or (self.log_head and f.read(len(self.log_head)) != self.log_head):
+                self._reset_log()
+            if size == self.log_offset:
+                return
+            f.seek(self.log_offset)
+            while chunk := f.read(1 << 20):
+                if not self.log_head:
+                    self.log_head = chunk[:64]
+                self.log_offset += len(chunk)
+                lines = (self.log_partial + chunk).split(b"\n")
+                self.log_partial = lines.pop()
+                self.log_lines += len(lines)
+                self.log_tail.extend(_decode_line(line) for line in lines[-_LOG_TAIL_MAX:])
+
+    def tail(self, n: int) -> list[str]:
+        """The last n lines, including a final line still being written."""
+        if n <= 0:
+            return []
+        lines = list(self.log_tail)
+        if self.log_partial:
+            lines.append(self.log_partial.decode("utf-8", "replace"))
+        return lines[-n:]
+
+    @property
+    def total_lines(self) -> int:
+        return self.log_lines + (1 if self.log_partial else 0)
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever the status file or the log has changed."""
+        mtime_ns, size = self.status_key or (0, 0)
+        log_offset = self.log_offset if self.log_exists else -1
+        return f"{mtime_ns:x}-{size:x}-{log_offset:x}"
+
+
+def _decode_line(line: bytes) -> str:
+    return line.decode("utf-8", "replace").rstrip("\r") + "\n"
+
+
+_RENDER_FILES = _StatusCache()
+
+
+async def _finish_job(job_id: str, job: dict, exit_code: int, now: float) -> dict:
+    """Build a finished job's final result and move it to _JOB_RESULTS."""
+    render_status = await asyncio.to_thread(_read_json_file, _STATUS_FILE) or {}
+
+    # Only trust a result file written by this job
+    result_file = _RESULT_FILE
+    render_result = None
+    try:
+        if result_file.stat().st_mtime >= job["started_at"]:
+            render_result = await asyncio.to_thread(_read_json_file, result_file)
+    except OSError:
+        pass
+
+    succeeded = exit_code == 0 and (render_result or {}).get("status") == "success"
+    result = {
+        "status": "completed" if succeeded else "failed",
+        "job_id": job_id,
+        "script_id": job["script_id"],
+        "exit_code": exit_code,
+        "output_location": f"data/shorts/output/{job['output_filename']}.mp4",
+        "result": render_result if render_result is not None else render_status
+    }
+    if not succeeded:
+        result["hint"] = "Use get_render_log to see what went wrong"
 
-        # Validate prerequisites BEFORE starting render
-        script_path = SHORTS_DIR / "scripts" / f"{script_id}.json"
-        audio_path = SHORTS_DIR / "audio" / f"{script_id}.mp3"
+    _JOBS.pop(job_id, None)  # A concurrent sweep may have settled it too
+    _JOB_RESULTS[job_id] = (now, result)
+    return result
 
-        if not script_path.exists():
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "message": f"Script not found: {script_path}",
-                "action_required": "Create a script first using create_script or save_script"
-            }, indent=2))]
 
-        if not audio_path.exists():
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "message": f"Audio not found: {audio_path}",
-                "action_required": "Generate audio first using generate_audio"
-            }, indent=2))]
-
-        # Initialize status file
-        status_file = SHORTS_DIR / "render_status.json"
-        status_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(status_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "phase": "starting",
-                "message": "Launching render process...",
-                "progress": 0,
-                "script_id": script_id,
-                "started_at": datetime.now().isoformat()
-            }, f, indent=2)
+async def _reap_jobs(now: float) -> None:
+    """
+    Drop expired results and settle every finished job.
 
-        # Launch render worker as separate process
-        # This ensures render continues even if MCP client disconnects
-        import subprocess
-        worker_script = Path(__file__).parent / "tools" / "render_worker.py"
+    Popen.poll() reaps the exited worker, so jobs nobody polls don't leave
+    zombie processes (or Popen objects) behind. Runs on each execute_render
+    and poll_job call.
+    """
+    for expired in [k for k, (at, _) in _JOB_RESULTS.items() if now - at > _JOB_RESULT_TTL]:
+        del _JOB_RESULTS[expired]
+
+    for job_id, job in list(_JOBS.items()):
+        exit_code = job["process"].poll()
+        if exit_code is not None:
+            await _finish_job(job_id, job, exit_code, now)
+
+
+@_tool_handler("poll_job")
+async def _handle_poll_job(arguments: dict) -> list[TextContent | ImageContent]:
+    job_id = arguments.get("job_id")
+    if not job_id:
+        return [_REPLY_JOB_ID_REQUIRED]
+
+    now = time.monotonic()
+    await _reap_jobs(now)
+
+    cached = _JOB_RESULTS.get(job_id)
+    if cached is not None:
+        return [_dump_textcontent(cached[1])]
+
+    job = _JOBS.get(job_id)
+    if job is None:
+        return [_dump_textcontent({
+            "status": "not_found",
+            "job_id": job_id,
+            "message": "Unknown job_id (it may have expired or the server restarted).",
+            "hint": "Use check_render_status to see the last render's status"
+        })]
+
+    # Still running (_reap_jobs settled it otherwise)
+    process = job["process"]
+    render_status = await asyncio.to_thread(_read_json_file, _STATUS_FILE) or {}
+    result = {
+        "status": "running",
+        "job_id": job_id,
+        "script_id": job["script_id"],
+        "pid": process.pid,
+        "phase": render_status.get("phase", "unknown"),
+        "progress": render_status.get("progress", 0),
+        "message": render_status.get("message", ""),
+        "elapsed_seconds": round(time.time() - job["started_at"], 1)
+    }
+    return [_dump_textcontent(result)]
 
-        # Create log file for worker output
-        worker_log = DATA_DIR / "render_worker.log"
 
-        try:
-            # Build command
-            cmd = [
-                sys.executable,  # Use same Python interpreter
-                str(worker_script),
-                script_id,
-                hook_text,
-                opening_image or "",
-                output_filename
-            ]
+@_tool_handler("get_render_log")
+async def _handle_get_render_log(arguments: dict) -> list[TextContent | ImageContent]:
+    # Read the render log file
+    log_file = _LOG_FILE
+    tail_lines = arguments.get("tail_lines", 100)
 
-            print(f"[MCP_SERVER] Launching worker: {' '.join(cmd)}", file=sys.stderr, flush=True)
-
-            # Launch detached process (continues after MCP disconnects)
-            # On Windows, use CREATE_NEW_PROCESS_GROUP and DETACHED_PROCESS
-            if sys.platform == "win32":
-                DETACHED_PROCESS = 0x00000008
-                CREATE_NEW_PROCESS_GROUP = 0x00000200
-                with open(worker_log, "w") as log_f:
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=log_f,
-                        stderr=subprocess.STDOUT,
-                        creationflags=DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP,
-                        close_fds=True
-                    )
+    try:
+        await _RENDER_FILES.refresh()
+        if _RENDER_FILES.log_exists:
+            if tail_lines <= _LOG_TAIL_MAX:
+                lines = _RENDER_FILES.tail(tail_lines)
             else:
-                # Unix: use nohup-like approach
-                with open(worker_log, "w") as log_f:
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=log_f,
-                        stderr=subprocess.STDOUT,
-                        start_new_session=True,
-                        close_fds=True
-                    )
-
-            # Verify process actually started by checking if it's running
-            import time
-            time.sleep(0.5)  # Brief pause to let process initialize
-
-            # Check if process is still running (poll() returns None if running)
-            process_running = process.poll() is None
-
-            # Also check if status file was updated by worker
-            status_updated = False
-            try:
-                if status_file.exists():
-                    with open(status_file, "r", encoding="utf-8") as f:
-                        current_status = json.load(f)
-                    status_updated = current_status.get("phase") == "worker_started"
-            except:
-                pass
+                lines = await asyncio.to_thread(_tail_file, log_file, tail_lines)
 
-            if process_running:
-                result = {
-                    "status": "render_running",
-                    "message": f"Video render is now running in background (PID: {process.pid}). This will take several minutes.",
-                    "script_id": script_id,
-                    "pid": process.pid,
-                    "process_verified": True,
-                    "status_file": str(status_file),
-                    "worker_log": str(worker_log),
-                    "output_location": f"data/shorts/output/{output_filename}.mp4",
-                    "important": "The render IS running. Use check_render_status to monitor progress.",
-                    "instructions": [
-                        "1. Render is CONFIRMED running in background",
-                        "2. Use check_render_status to see progress and logs",
-                        "3. You can close this chat - render will continue",
-                        f"4. Final video will be at: data/shorts/output/{output_filename}.mp4",
-                        f"5. To stop render if needed: kill process {process.pid}"
-                    ]
-                }
-            else:
-                # Process exited immediately - check for error
-                result = {
-                    "status": "error",
-                    "message": "Render process exited immediately. Check worker log for details.",
-                    "script_id": script_id,
-                    "exit_code": process.returncode,
-                    "worker_log": str(worker_log),
-                    "hint": "Try running manually: python lds_mcp/tools/render_worker.py ..."
-                }
+            log_content = "".join(lines)
+            result = {
+                "status": "success",
+                "log_file": str(log_file),
+                "total_lines": len(lines),
+                "log_lines_total": _RENDER_FILES.total_lines,
+                "content": log_content
+            }
+        else:
+            result = {
+                "status": "no_log",
+                "message": f"Log file not found: {log_file}",
+                "hint": "Run execute_render first to generate logs"
+            }
+    except Exception as e:
+        result = {
+            "status": "error",
+            "message": str(e)
+        }
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [_dump_textcontent(result)]
 
-        except Exception as e:
-            import traceback
-            error_tb = traceback.format_exc()
-            print(f"[MCP_SERVER] Failed to launch worker: {e}", file=sys.stderr, flush=True)
-            error_result = {
-                "status": "error",
-                "message": f"Failed to launch render worker: {str(e)}",
-                "traceback": error_tb
-            }
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
 
-    elif name == "get_render_log":
-        # Read the render log file
-        log_file = DATA_DIR / "render_log.txt"
-        tail_lines = arguments.get("tail_lines", 100)
+@_tool_handler("check_render_status")
+async def _handle_check_render_status(arguments: dict) -> list[TextContent | ImageContent]:
+    # Check status of background render
+    result = {
+        "status": "unknown",
+        "phase": "unknown",
+        "message": "No render status available"
+    }
 
-        try:
-            if log_file.exists():
-                with open(log_file, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-
-                # Get last N lines
-                if len(lines) > tail_lines:
-                    lines = lines[-tail_lines:]
-
-                log_content = "".join(lines)
-                result = {
-                    "status": "success",
-                    "log_file": str(log_file),
-                    "total_lines": len(lines),
-                    "content": log_content
-                }
+    fingerprint = None
+    try:
+        await _RENDER_FILES.refresh()
+    except Exception as e:
+        result["status_error"] = str(e)
+    else:
+        # Nothing changed on disk since the last poll: resend the same reply
+        fingerprint = _RENDER_FILES.fingerprint
+        cached = _RENDER_FILES.reply
+        if cached is not None and cached[0] == fingerprint:
+            return [cached[1]]
+
+    # Read status file if exists
+    if _RENDER_FILES.status_dict is not None:
+        result = dict(_RENDER_FILES.status_dict)  # The cached dict is shared
+        result["status"] = "found"
+    elif _RENDER_FILES.status_error:
+        result["status_error"] = _RENDER_FILES.status_error
+
+    # Always include recent logs
+    if _RENDER_FILES.log_exists:
+        result["logs"] = "".join(_RENDER_FILES.tail(30))  # Last 30 lines
+        result["log_lines_total"] = _RENDER_FILES.total_lines
+
+    if fingerprint is None:
+        return [_dump_textcontent(result)]  # Refresh failed; don't cache
+
+    result["fingerprint"] = fingerprint
+    reply = _dump_textcontent(result)
+    _RENDER_FILES.reply = (fingerprint, reply)
+    return [reply]
+
+
+@_tool_handler("stop_render")
+async def _handle_stop_render(arguments: dict) -> list[TextContent | ImageContent]:
+    pid = arguments.get("pid")
+    force = arguments.get("force", False)
+
+    if not pid:
+        return [_dump_textcontent({
+            "status": "error",
+            "message": "PID is required. Get it from check_render_status or execute_render response."
+        })]
+
+    try:
+        if sys.platform == "win32":
+            # Windows: use taskkill
+            if force:
+                subprocess.run(["taskkill", "/F", "/PID", str(pid)], capture_output=True)
             else:
-                result = {
-                    "status": "no_log",
-                    "message": f"Log file not found: {log_file}",
-                    "hint": "Run execute_render first to generate logs"
-                }
-        except Exception as e:
-            result = {
-                "status": "error",
-                "message": str(e)
-            }
-
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                subprocess.run(["taskkill", "/PID", str(pid)], capture_output=True)
+        else:
+            # Unix: send signal
+            os.kill(pid, signal.SIGKILL if force else signal.SIGTERM)
 
-    elif name == "check_render_status":
-        # Check status of background render
-        status_file = SHORTS_DIR / "render_status.json"
-        log_file = DATA_DIR / "render_log.txt"
+        # Update status file
+        status_file = _STATUS_FILE
+        write_status_atomic(status_file, {
+            "phase": "stopped",
+            "message": f"Render stopped by user (PID: {pid})",
+            "stopped_at": iso_now()
+        }, durable=True)
 
         result = {
-            "status": "unknown",
-            "phase": "unknown",
-            "message": "No render status available"
+            "status": "success",
+            "message": f"Render process {pid} has been stopped.",
+            "pid": pid,
+            "force": force
+        }
+    except ProcessLookupError:
+        result = {
+            "status": "not_found",
+            "message": f"Process {pid} not found. It may have already completed or been stopped.",
+            "pid": pid
+        }
+    except PermissionError:
+        result = {
+            "status": "error",
+            "message": f"Permission denied to stop process {pid}.",
+            "pid": pid
+        }
+    except Exception as e:
+        result = {
+            "status": "error",
+            "message": f"Failed to stop process: {str(e)}",
+            "pid": pid
         }
 
-        # Read status file if exists
-        try:
-            if status_file.exists():
-                with open(status_file, "r", encoding="utf-8") as f:
-                    result = json.load(f)
-                result["status"] = "found"
-        except Exception as e:
-            result["status_error"] = str(e)
+    return [_dump_textcontent(result)]
 
-        # Always include recent logs
-        try:
-            if log_file.exists():
-                with open(log_file, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                result["logs"] = "".join(lines[-30:])  # Last 30 lines
-                result["log_lines_total"] = len(lines)
-        except Exception as e:
-            result["log_error"] = str(e)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+@_tool_handler("list_projects")
+async def _handle_list_projects(arguments: dict) -> list[TextContent | ImageContent]:
+    pm = _PM
+    projects = await _run_fs(pm.list_projects)
+    current = pm.get_current_project()
 
-    elif name == "stop_render":
-        pid = arguments.get("pid")
-        force = arguments.get("force", False)
+    result = {
+        "current_project": current,
+        "projects": projects
+    }
+    return [_dump_textcontent(result)]
 
-        if not pid:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "message": "PID is required. Get it from check_render_status or execute_render response."
-            }, indent=2))]
 
-        try:
-            import signal
-
-            if sys.platform == "win32":
-                # Windows: use taskkill
-                import subprocess
-                if force:
-                    subprocess.run(["taskkill", "/F", "/PID", str(pid)], capture_output=True)
-                else:
-                    subprocess.run(["taskkill", "/PID", str(pid)], capture_output=True)
-            else:
-                # Unix: send signal
-                os.kill(pid, signal.SIGKILL if force else signal.SIGTERM)
-
-            # Update status file
-            status_file = SHORTS_DIR / "render_status.json"
-            with open(status_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "phase": "stopped",
-                    "message": f"Render stopped by user (PID: {pid})",
-                    "stopped_at": datetime.now().isoformat()
-                }, f, indent=2)
+def _list_dir(directory: str, listings: dict | None = None) -> frozenset[str]:
+    """
+    Entry names of a directory from a single scandir (no per-file stat).
 
-            result = {
-                "status": "success",
-                "message": f"Render process {pid} has been stopped.",
-                "pid": pid,
-                "force": force
-            }
-        except ProcessLookupError:
-            result = {
-                "status": "not_found",
-                "message": f"Process {pid} not found. It may have already completed or been stopped.",
-                "pid": pid
-            }
-        except PermissionError:
-            result = {
-                "status": "error",
-                "message": f"Permission denied to stop process {pid}.",
-                "pid": pid
-            }
-        except Exception as e:
-            result = {
-                "status": "error",
-                "message": f"Failed to stop process: {str(e)}",
-                "pid": pid
-            }
+    A listings dict shares the result between lookups, so checking many
+    projects still scans each folder once.
+    """
+    if listings is not None and directory in listings:
+        return listings[directory]
+    try:
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        names = frozenset()
+    if listings is not None:
+        listings[directory] = names
+    return names
+
+
+# Project ids are used as file names: reject anything else before touching the disk
+_VALID_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _valid_id(project_id) -> bool:
+    return isinstance(project_id, str) and _VALID_ID.fullmatch(project_id) is not None
+
+
+def _invalid_id(project_id) -> dict:
+    return {"project_id": project_id, "error": "invalid project id"}
+
+
+def _status_for(project_id: str, listings: dict | None = None) -> dict:
+    """Which files exist for a project: one directory scan per project folder."""
+    if not _valid_id(project_id):
+        return _invalid_id(project_id)
+    audio = _list_dir(_AUDIO_DIR_STR, listings)
+    image_prefix = f"{project_id}_"
+    return {
+        "project_id": project_id,
+        "script": f"{project_id}.json" in _list_dir(_SCRIPTS_DIR_STR, listings),
+        "audio": f"{project_id}.mp3" in audio,
+        "timestamps": f"{project_id}_timestamps.json" in audio,
+        # Names only, as ProjectManager.get_project_status reports them
+        "images": sorted(
+            name for name in _list_dir(_SHORT_IMAGES_DIR_STR, listings)
+            if name.startswith(image_prefix)
+        ),
+        "video": f"{project_id}.mp4" in _list_dir(_OUTPUT_DIR_STR, listings)
+    }
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-    elif name == "list_projects":
-        pm = get_project_manager(DATA_DIR.parent)
-        projects = pm.list_projects()
-        current = pm.get_current_project()
+def _project_status(project_id: str) -> dict:
+    """Detailed status from the project manager, or the scanned summary if that fails."""
+    # None means the current project
+    if project_id is not None and not _valid_id(project_id):
+        return _invalid_id(project_id)
+    try:
+        return _PM.get_project_status(project_id)
+    except:
+        return _status_for(project_id)
+
+
+# Recent status results, (kind, project_id) -> (monotonic time, status).
+# Clients poll get_project_status during a render; within the TTL a repeat
+# poll is answered without touching the disk. Only read and written from the
+# event loop, so the worker threads never see it.
+_STATUS_TTL = 0.5
+_STATUS_CACHE_MAX = 256
+_STATUS_CACHE: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+
+
+def _status_cache_get(key: tuple[str, str], now: float) -> dict | None:
+    hit = _STATUS_CACHE.get(key)
+    if hit is not None and now - hit[0] < _STATUS_TTL:
+        return hit[1]
+    return None
+
+
+def _status_cache_put(key: tuple[str, str], now: float, status: dict) -> None:
+    _STATUS_CACHE[key] = (now, status)
+    _STATUS_CACHE.move_to_end(key)
+    if len(_STATUS_CACHE) > _STATUS_CACHE_MAX:
+        _STATUS_CACHE.popitem(last=False)
+
+
+# The state manager's status report, shared for a moment: get_status and the
+# welcome prompt each need it, and clients tend to ask for both back to back
+_STATUS_REPORT_TTL = 1.0
+_status_report_cache: tuple[float, dict] | None = None
+
+
+def _status_report() -> dict:
+    global _status_report_cache
+    now = time.monotonic()
+    if _status_report_cache is not None and now - _status_report_cache[0] < _STATUS_REPORT_TTL:
+        return _status_report_cache[1]
+    report = _STATE.get_status_report()
+    _status_report_cache = (now, report)
+    return report
+
+
+def _invalidate_status(project_id: str | None = None) -> None:
+    """Forget cached status for one project, or for all of them."""
+    global _status_report_cache
+    _status_report_cache = None  # Any change may move the current project's phase
+    if project_id is None:
+        _STATUS_CACHE.clear()
+    else:
+        _STATUS_CACHE.pop(("summary", project_id), None)
+        _STATUS_CACHE.pop(("detail", project_id), None)
+
+
+async def _status_many(project_ids: list[str]) -> list[dict]:
+    """Status for several projects, probing on worker threads with shared folder listings."""
+    if isinstance(project_ids, str):
+        project_ids = [project_ids]  # One id, not a sequence of characters
+    now = time.monotonic()
+    statuses = [
+        _status_cache_get(("summary", project_id), now) if isinstance(project_id, str) else None
+        for project_id in project_ids
+    ]
+    missing = [i for i, status in enumerate(statuses) if status is None]
+    if missing:
+        listings = {}
+        fresh = await asyncio.gather(
+            *(asyncio.to_thread(_status_for, project_ids[i], listings) for i in missing)
+        )
+        for i, status in zip(missing, fresh):
+            statuses[i] = status
+            if "error" not in status:
+                _status_cache_put(("summary", project_ids[i]), now, status)
+    return statuses
+
+
+@_tool_handler("get_project_status")
+async def _handle_get_project_status(arguments: dict) -> list[TextContent | ImageContent]:
+    project_ids = arguments.get("project_ids")
+    if project_ids:
+        statuses = await _status_many(project_ids)
+        return [_dump_textcontent({"projects": statuses})]
+
+    project_id = arguments.get("project_id")
+    key = ("detail", project_id or _PM.get_current_project())
+    now = time.monotonic()
+    status = _status_cache_get(key, now) if isinstance(key[1], str) else None
+    if status is None:
+        status = await asyncio.to_thread(_project_status, project_id)
+        if "error" not in status and isinstance(key[1], str):
+            _status_cache_put(key, now, status)
+    return [_dump_textcontent(status)]
+
+
+@_tool_handler("save_script")
+async def _handle_save_script(arguments: dict) -> list[TextContent | ImageContent]:
+    script_json = arguments.get("script_json")
+    project_id = arguments.get("project_id")
+
+    if not script_json:
+        return [TextContent(type="text", text="Error: script_json is required")]
+
+    pm = _PM
+
+    try:
+        saved_id = await _run_fs(pm.save_script, script_json, project_id)
+        _invalidate_status(saved_id)
+        _parse_script.cache_clear()  # Don't trust mtime granularity for a file just rewritten
+        paths = _project_paths(saved_id)
 
         result = {
-            "current_project": current,
-            "projects": projects
+            "status": "success",
+            "project_id": saved_id,
+            "saved_to": paths.script_file_str,
+            "legacy_copy": paths.legacy_production_plan_str,
+            "next_steps": [
+                _STEP_GEN_AUDIO + str(saved_id) + "'",
+                _STEP_RENDER_DIRECT + str(saved_id) + "'"
+            ]
         }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [_dump_textcontent(result, pretty=True)]
 
-    elif name == "get_project_status":
-        project_id = arguments.get("project_id")
-        pm = get_project_manager(DATA_DIR.parent)
-        try:
-            status = pm.get_project_status(project_id)
-        except:
-            status = {
-                "project_id": project_id,
-                "script": (SHORTS_DIR / "scripts" / f"{project_id}.json").exists(),
-                "audio": (SHORTS_DIR / "audio" / f"{project_id}.mp3").exists(),
-                "timestamps": (SHORTS_DIR / "audio" / f"{project_id}_timestamps.json").exists(),
-                "images": list((SHORTS_DIR / "images").glob(f"{project_id}_*")) if (SHORTS_DIR / "images").exists() else [],
-                "video": (SHORTS_DIR / "output" / f"{project_id}.mp4").exists()
-            }
-        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error saving script: {str(e)}")]
 
-    elif name == "save_script":
-        script_json = arguments.get("script_json")
-        project_id = arguments.get("project_id")
 
-        if not script_json:
-            return [TextContent(type="text", text="Error: script_json is required")]
+async def _operation_tool(handler, arguments: dict, on_result=None) -> list[TextContent | ImageContent]:
+    """Shared body of the operation-dispatching tools (manage_files, workflow)."""
+    operation = arguments.get("operation")
 
-        pm = get_project_manager(DATA_DIR.parent)
+    if not operation:
+        return [TextContent(type="text", text="Error: operation is required")]
 
-        try:
-            saved_id = pm.save_script(script_json, project_id)
-            paths = pm.get_paths(saved_id)
+    result = await handler(
+        operation=operation,
+        arguments=arguments,
+        base_dir=_DATA_PARENT
+    )
+    if on_result is not None:
+        on_result(operation, result)
+    return [_dump_textcontent(result)]
 
-            result = {
-                "status": "success",
-                "project_id": saved_id,
-                "saved_to": str(paths.script_file),
-                "legacy_copy": str(paths.legacy_production_plan),
-                "next_steps": [
-                    f"Generate audio: use generate_audio with script_id='{saved_id}'",
-                    f"Or render directly: use render_short with script_id='{saved_id}'"
-                ]
-            }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error saving script: {str(e)}")]
 
-    elif name == "manage_files":
-        operation = arguments.get("operation")
+def _after_file_operation(operation: str, result: dict) -> None:
+    _invalidate_status()  # File operations can touch any project's folders
 
-        if not operation:
-            return [TextContent(type="text", text="Error: operation is required")]
 
-        result = await handle_file_operation(
-            operation=operation,
-            arguments=arguments,
-            base_dir=DATA_DIR.parent
+def _after_workflow_operation(operation: str, result: dict) -> None:
+    # Update project state when workflow creates/updates project
+    if operation == "create_project" and result.get("status") == "project_created":
+        sm = _STATE
+        sm.start_new_project(
+            project_id=result.get("project_id"),
+            topic=result.get("topic", ""),
+            hook_text=result.get("parameters", {}).get("hook_question", "")
         )
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        _invalidate_status()
 
-    elif name == "workflow":
-        operation = arguments.get("operation")
 
-        if not operation:
-            return [TextContent(type="text", text="Error: operation is required")]
-
-        result = await handle_workflow_operation(
-            operation=operation,
-            arguments=arguments,
-            base_dir=DATA_DIR.parent
-        )
+_TOOL_HANDLERS["manage_files"] = functools.partial(
+    _operation_tool, handle_file_operation, on_result=_after_file_operation
+)
+_TOOL_HANDLERS["workflow"] = functools.partial(
+    _operation_tool, handle_workflow_operation, on_result=_after_workflow_operation
+)
 
-        # Update project state when workflow creates/updates project
-        if operation == "create_project" and result.get("status") == "project_created":
-            sm = get_state_manager(DATA_DIR.parent)
-            sm.start_new_project(
-                project_id=result.get("project_id"),
-                topic=result.get("topic", ""),
-                hook_text=result.get("parameters", {}).get("hook_question", "")
-            )
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+@_tool_handler("get_status")
+async def _handle_get_status(arguments: dict) -> list[TextContent | ImageContent]:
+    # Get comprehensive status report (one report feeds both parts)
+    status_report = _status_report()
+    welcome = get_welcome_message(status_report)
 
-    elif name == "get_status":
-        # Get comprehensive status report
-        welcome = get_welcome_message()
-        sm = get_state_manager(DATA_DIR.parent)
-        status_report = sm.get_status_report()
+    result = {
+        "welcome_message": welcome["message"],
+        "phase": welcome["phase"],
+        "status": status_report
+    }
+    return [_dump_textcontent(result, pretty=True)]
 
-        result = {
-            "welcome_message": welcome["message"],
-            "phase": welcome["phase"],
-            "status": status_report
-        }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-    elif name == "archive_project":
-        sm = get_state_manager(DATA_DIR.parent)
-        project_id = arguments.get("project_id")
-        delete_source = arguments.get("delete_source", True)
+@_tool_handler("archive_project")
+async def _handle_archive_project(arguments: dict) -> list[TextContent | ImageContent]:
+    sm = _STATE
+    project_id = arguments.get("project_id")
+    delete_source = arguments.get("delete_source", True)
 
+    def archive():
         # If specific project_id, update state first
         if project_id:
             sm._state.project_id = project_id
             sm.refresh_state()
+        return sm.archive_current_project(delete_after=delete_source)
 
-        result = sm.archive_current_project(delete_after=delete_source)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    result = await _run_fs(archive)
+    _MKDIR_CACHE.clear()  # Archiving may remove project directories
+    _reset_image_manager()
+    _invalidate_status()
+    return [_dump_textcontent(result)]
 
-    elif name == "cleanup_workspace":
-        confirm = arguments.get("confirm", False)
-        archive_first = arguments.get("archive_first", True)
 
-        if not confirm:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "confirmation_required",
-                "message": "This will remove all project files. Set confirm=true to proceed.",
-                "warning": "All files in data/shorts/ will be deleted (archived first if archive_first=true)"
-            }, indent=2))]
+@_tool_handler("cleanup_workspace")
+async def _handle_cleanup_workspace(arguments: dict) -> list[TextContent | ImageContent]:
+    confirm = arguments.get("confirm", False)
+    archive_first = arguments.get("archive_first", True)
 
-        sm = get_state_manager(DATA_DIR.parent)
-        result = sm.cleanup_all(archive_first=archive_first)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    if not confirm:
+        return [_REPLY_CONFIRM_CLEANUP]
 
-    elif name == "list_archived":
-        sm = get_state_manager(DATA_DIR.parent)
-        archived = sm.list_archived_projects()
+    sm = _STATE
+    result = await _run_fs(sm.cleanup_all, archive_first=archive_first)
+    _MKDIR_CACHE.clear()  # Cleanup may remove project directories
+    _reset_image_manager()
+    _invalidate_status()
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("list_archived")
+async def _handle_list_archived(arguments: dict) -> list[TextContent | ImageContent]:
+    sm = _STATE
+    archived = await _run_fs(sm.list_archived_projects)
+
+    result = {
+        "archived_projects": archived,
+        "total": len(archived),
+        "archive_location": str(sm.archive_dir)
+    }
+    return [_dump_textcontent(result)]
+
+
+@_tool_handler("batch_execute")
+async def _handle_batch_execute(arguments: dict) -> list[TextContent | ImageContent]:
+    operations = arguments.get("operations") or []
+    max_concurrent = max(1, int(arguments.get("max_concurrent") or 4))  # null -> default
+    stop_on_error = arguments.get("stop_on_error", False)
+
+    if not operations:
+        return [TextContent(type="text", text="Error: operations is required")]
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run(operation: dict):
+        if not isinstance(operation, dict):
+            raise ValueError("Operation must be an object with 'tool' and 'arguments'")
+        tool = operation.get("tool")
+        handler = _TOOL_HANDLERS.get(tool)
+        if handler is None or handler is _handle_batch_execute:
+            raise ValueError(f"Unknown tool: {tool}")
+        async with semaphore:
+            contents = await handler(operation.get("arguments") or {})
+        text = "".join(c.text for c in contents if c.type == "text")
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            return text  # Plain-text replies (e.g. "Error: ...") pass through as-is
+
+    tasks = [asyncio.create_task(run(op)) for op in operations]
+    if stop_on_error:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = []
+    errors = []
+    for index, (operation, task) in enumerate(zip(operations, tasks)):
+        entry = {"index": index, "tool": operation.get("tool") if isinstance(operation, dict) else None}
+        if task.cancelled():
+            errors.append({**entry, "error": "Cancelled after an earlier operation failed"})
+        elif task.exception() is not None:
+            errors.append({**entry, "error": str(task.exception())})
+        else:
+            results.append({**entry, "result": task.result()})
+
+    result = {
+        "status": "success" if not errors else "partial" if results else "error",
+        "results": results,
+        "errors": errors
+    }
+    return [_dump_textcontent(result)]
 
-        result = {
-            "archived_projects": archived,
-            "total": len(archived),
-            "archive_location": str(sm.archive_dir)
-        }
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
+    """Handle tool calls."""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
+
+
+# Static prompt definitions and templates, built once at import
+_PROMPTS = (
+    Prompt(
+        name="welcome",
+        description="Start here! Check project status and get guidance on what to do next.",
+        arguments=[]
+    ),
+    Prompt(
+        name="new_video",
+        description="Start creating a new video from scratch",
+        arguments=[
+            {"name": "topic", "description": "Video topic", "required": True}
+        ]
+    ),
+    Prompt(
+        name="daily_inspiration",
+        description="Create a daily inspirational short connecting world events with gospel principles",
+        arguments=[
+            {"name": "news_topic", "description": "Current event or theme", "required": False}
+        ]
+    ),
+    Prompt(
+        name="scripture_explanation",
+        description="Create a short explaining a scripture or doctrine",
+        arguments=[
+            {"name": "scripture", "description": "Scripture reference", "required": True}
+        ]
+    ),
+    Prompt(
+        name="prophet_teaching",
+        description="Create a short based on a prophet's teaching",
+        arguments=[
+            {"name": "prophet", "description": "Prophet name", "required": True},
+            {"name": "topic", "description": "Teaching topic", "required": True}
+        ]
+    )
+)
+
+_DAILY_TMPL = """Create an inspirational LDS short video about: {news_topic}
+
+Steps:
+1. First, use search_world_news to find relevant current events
+2. Use search_lds_content to find related scriptures and prophet quotes
+3. Use verify_quote to ensure all quotes are accurate
+4. Use create_script to generate the dialogue
+5. Show me the script for approval before generating audio"""
+
+_SCRIPTURE_TMPL = """Create an LDS short explaining: {scripture}
+
+Steps:
+1. Use search_lds_content to get context about this scripture
+2. Use create_script with this context
+3. Show me the script for approval"""
+
+_PROPHET_TMPL = """Create an LDS short about {prophet}'s teaching on {topic}
+
+Steps:
+1. Use search_lds_content to find quotes from {prophet}
+2. Use verify_quote on each quote found
+3. Use create_script with verified quotes
+4. Show me the script for approval"""
+
+
+def _prompt_result(text: str) -> GetPromptResult:
+    """Wrap prompt text as a single user message."""
+    return GetPromptResult(
+        messages=[PromptMessage(role="user", content=TextContent(type="text", text=text))]
+    )
 
 
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """List available prompts for common tasks."""
-    return [
-        Prompt(
-            name="welcome",
-            description="Start here! Check project status and get guidance on what to do next.",
-            arguments=[]
-        ),
-        Prompt(
-            name="new_video",
-            description="Start creating a new video from scratch",
-            arguments=[
-                {"name": "topic", "description": "Video topic", "required": True}
-            ]
-        ),
-        Prompt(
-            name="daily_inspiration",
-            description="Create a daily inspirational short connecting world events with gospel principles",
-            arguments=[
-                {"name": "news_topic", "description": "Current event or theme", "required": False}
-            ]
-        ),
-        Prompt(
-            name="scripture_explanation",
-            description="Create a short explaining a scripture or doctrine",
-            arguments=[
-                {"name": "scripture", "description": "Scripture reference", "required": True}
-            ]
-        ),
-        Prompt(
-            name="prophet_teaching",
-            description="Create a short based on a prophet's teaching",
-            arguments=[
-                {"name": "prophet", "description": "Prophet name", "required": True},
-                {"name": "topic", "description": "Teaching topic", "required": True}
-            ]
-        )
-    ]
+    return list(_PROMPTS)
 
 
-@server.get_prompt()
-async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
-    """Get a specific prompt template."""
+# Prompt name -> builder returning the prompt text, filled in by @_prompt_builder
+_PROMPT_BUILDERS: dict = {}
 
-    if name == "welcome":
-        # Get current status
-        welcome = get_welcome_message()
-        sm = get_state_manager(DATA_DIR.parent)
-        status = sm.get_status_report()
 
-        # Build contextual welcome message
-        phase = status["current_phase"]
+def _prompt_builder(name: str):
+    """Register a function as the text builder for an MCP prompt."""
+    def register(builder):
+        _PROMPT_BUILDERS[name] = builder
+        return builder
+    return register
 
-        if phase["id"] == "idle":
-            prompt_text = f"""{welcome['message']}
+
+@_prompt_builder("welcome")
+def _build_welcome(arguments: dict) -> str:
+    # Get current status
+    status = _status_report()
+    welcome = get_welcome_message(status)
+
+    # Build contextual welcome message
+    phase = status["current_phase"]
+
+    if phase["id"] == "idle":
+        prompt_text = f"""{welcome['message']}
 
 I've checked your project status. You have no active project.
 
@@ -1384,9 +1954,9 @@ I've checked your project status. You have no active project.
 
 What would you like to do?"""
 
-        elif phase["id"] == "complete":
-            project = status["project"]
-            prompt_text = f"""{welcome['message']}
+    elif phase["id"] == "complete":
+        project = status["project"]
+        prompt_text = f"""{welcome['message']}
 
 Your video for **"{project['topic']}"** is complete!
 
@@ -1397,11 +1967,12 @@ Your video for **"{project['topic']}"** is complete!
 
 What would you like to do?"""
 
-        else:
-            project = status["project"]
-            files = status["files"]
+    else:
+        project = status["project"]
+        files = status["files"]
+        next_steps = "".join(f"- {action}\n" for action in status["next_actions"])
 
-            prompt_text = f"""{welcome['message']}
+        prompt_text = f"""{welcome['message']}
 
 **Current project:** {project.get('topic', 'Untitled')} ({project.get('id', 'unknown')})
 
@@ -1411,34 +1982,22 @@ What would you like to do?"""
 - Video: {'Done' if files['video'] else 'Pending'}
 
 **Next steps:**
-"""
-            for action in status["next_actions"]:
-                prompt_text += f"- {action}\n"
-
-            prompt_text += "\nWould you like me to continue with the next step?"
-
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=prompt_text
-                    )
-                )
-            ]
-        )
+{next_steps}
+Would you like me to continue with the next step?"""
+
+    return prompt_text
 
-    elif name == "new_video":
-        topic = arguments.get("topic", "")
 
-        # Check for existing project
-        sm = get_state_manager(DATA_DIR.parent)
-        status = sm.get_status_report()
+@_prompt_builder("new_video")
+def _build_new_video(arguments: dict) -> str:
+    topic = arguments.get("topic", "")
 
-        if status["current_phase"]["id"] not in ["idle", "archived"]:
-            existing_topic = status["project"].get("topic", "Unknown")
-            prompt_text = f"""You want to create a new video about: **{topic}**
+    # Check for existing project
+    status = _status_report()
+
+    if status["current_phase"]["id"] not in ["idle", "archived"]:
+        existing_topic = status["project"].get("topic", "Unknown")
+        prompt_text = f"""You want to create a new video about: **{topic}**
 
 However, there's an existing project for "{existing_topic}".
 
@@ -1448,8 +2007,8 @@ However, there's an existing project for "{existing_topic}".
 3. Abandon current project (not recommended)
 
 What would you like to do?"""
-        else:
-            prompt_text = f"""Let's create a new video about: **{topic}**
+    else:
+        prompt_text = f"""Let's create a new video about: **{topic}**
 
 I'll guide you through each step:
 
@@ -1464,81 +2023,45 @@ Use these tools:
 - search_lds_content to find scriptures
 - workflow(operation="create_project", topic="{topic}") to initialize"""
 
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=prompt_text
-                    )
-                )
-            ]
-        )
+    return prompt_text
 
-    elif name == "daily_inspiration":
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""Create an inspirational LDS short video about: {arguments.get('news_topic', 'finding peace in troubled times')}
 
-Steps:
-1. First, use search_world_news to find relevant current events
-2. Use search_lds_content to find related scriptures and prophet quotes
-3. Use verify_quote to ensure all quotes are accurate
-4. Use create_script to generate the dialogue
-5. Show me the script for approval before generating audio"""
-                    )
-                )
-            ]
-        )
+@_prompt_builder("daily_inspiration")
+def _build_daily_inspiration(arguments: dict) -> str:
+    news_topic = arguments.get('news_topic', 'finding peace in troubled times')
+    return _DAILY_TMPL.format(news_topic=news_topic)
 
-    elif name == "scripture_explanation":
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""Create an LDS short explaining: {arguments.get('scripture')}
 
-Steps:
-1. Use search_lds_content to get context about this scripture
-2. Use create_script with this context
-3. Show me the script for approval"""
-                    )
-                )
-            ]
-        )
+@_prompt_builder("scripture_explanation")
+def _build_scripture_explanation(arguments: dict) -> str:
+    return _SCRIPTURE_TMPL.format(scripture=arguments.get('scripture'))
 
-    elif name == "prophet_teaching":
-        return GetPromptResult(
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""Create an LDS short about {arguments.get('prophet')}'s teaching on {arguments.get('topic')}
 
-Steps:
-1. Use search_lds_content to find quotes from {arguments.get('prophet')}
-2. Use verify_quote on each quote found
-3. Use create_script with verified quotes
-4. Show me the script for approval"""
-                    )
-                )
-            ]
-        )
+@_prompt_builder("prophet_teaching")
+def _build_prophet_teaching(arguments: dict) -> str:
+    return _PROPHET_TMPL.format(
+        prophet=arguments.get('prophet'),
+        topic=arguments.get('topic')
+    )
+
 
-    return GetPromptResult(messages=[])
+@server.get_prompt()
+async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
+    """Get a specific prompt template."""
+    builder = _PROMPT_BUILDERS.get(name)
+    if builder is None:
+        return GetPromptResult(messages=[])
+    return _prompt_result(builder(arguments or {}))
 
 
 async def main():
     """Run the MCP server."""
-    print("Starting Zero Sum LDS MCP Server...", file=sys.stderr)
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("LDS_MCP_DEBUG") else logging.INFO,
+        stream=sys.stderr,
+        format="[%(name)s] %(levelname)s %(message)s"
+    )
+    os.write(2, b"Starting Zero Sum LDS MCP Server...\n")  # One unbuffered write to stderr
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -1548,5 +2071,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: libuv event loop for the stdio read/write cycle
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
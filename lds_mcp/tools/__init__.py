@@ -1,10 +1,17 @@
 """MCP Tools for Zero Sum LDS Video Creation."""
 
-from .script_generator import create_lds_script
-from .content_search import search_lds_content, search_world_news
-from .quote_verifier import verify_lds_quote
-from .image_manager import ImageManager
-from .short_renderer import render_short_video
+import importlib
+
+# Public name -> submodule, imported on first access (PEP 562) so that
+# importing one tool module doesn't load all of them.
+_LAZY = {
+    "create_lds_script": ".script_generator",
+    "search_lds_content": ".content_search",
+    "search_world_news": ".content_search",
+    "verify_lds_quote": ".quote_verifier",
+    "ImageManager": ".image_manager",
+    "render_short_video": ".short_renderer",
+}
 
 __all__ = [
     "create_lds_script",
@@ -14,3 +21,16 @@ __all__ = [
     "ImageManager",
     "render_short_video",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
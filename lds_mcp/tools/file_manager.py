@@ -6,6 +6,7 @@ Security: Operations are restricted to the project directory tree.
 This prevents accidental or malicious file operations outside the project.
 """
 
+import fnmatch
 import os
 import shutil
 import json
@@ -14,6 +15,31 @@ from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 
+def _scan_matching(top: str, pattern: str, recursive: bool):
+    """
+    Yield (entry, relative_path) for entries under top whose name matches
+    pattern, like Path.glob / Path.rglob with a single-segment pattern.
+
+    os.scandir entries carry the file type (and on Windows the stat) from
+    the directory read itself, so matching and classifying them costs no
+    extra syscall per entry. Like rglob, symlinked directories are listed
+    but not descended into, and unreadable directories are skipped.
+    """
+    stack = [(top, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    relative_path = prefix + entry.name
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        yield entry, relative_path
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, relative_path + os.sep))
+        except PermissionError:
+            continue
+
+
 class FileManager:
     """
     Secure file management within the project directory.
@@ -353,16 +379,18 @@ class FileManager:
             files = []
             dirs = []
 
-            if include_subdirs:
-                items = list(dir_path.rglob(pattern))
+            if "/" in pattern or os.sep in pattern or "**" in pattern:
+                # Multi-segment patterns need pathlib's own matching
+                items = dir_path.rglob(pattern) if include_subdirs else dir_path.glob(pattern)
+                entries = ((item, str(item.relative_to(dir_path))) for item in items)
             else:
-                items = list(dir_path.glob(pattern))
+                entries = _scan_matching(os.fspath(dir_path), pattern, include_subdirs)
 
-            for item in items:
+            for item, relative_path in entries:
                 info = {
                     "name": item.name,
-                    "path": str(item),
-                    "relative_path": str(item.relative_to(dir_path))
+                    "path": os.fspath(item),
+                    "relative_path": relative_path
                 }
 
                 if item.is_file():
@@ -3,12 +3,13 @@ Image Manager for Manual Image Upload and Ordering
 Handles image registration and intelligent ordering based on script content.
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+import orjson
+
 
 class ImageManager:
     """Manages manually uploaded images for video assembly."""
@@ -27,14 +28,14 @@ class ImageManager:
     def _load_registry(self) -> dict:
         """Load the image registry from disk."""
         if self.registry_file.exists():
-            with open(self.registry_file) as f:
-                return json.load(f)
+            with open(self.registry_file, "rb") as f:
+                return orjson.loads(f.read())
         return {"images": [], "scripts": {}}
 
     def _save_registry(self):
         """Save the image registry to disk."""
-        with open(self.registry_file, "w") as f:
-            json.dump(self.registry, f, indent=2)
+        with open(self.registry_file, "wb") as f:
+            f.write(orjson.dumps(self.registry, option=orjson.OPT_INDENT_2))
 
     async def register_images(
         self,
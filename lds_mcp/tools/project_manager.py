@@ -6,14 +6,38 @@ This module ensures consistency between MCP tools and CLI handlers,
 eliminating the manual file management that was previously required.
 """
 
-import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, field, asdict
 
+import orjson
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write via a temp file + os.replace so readers never see a partial file.
+
+    Each write gets its own temp file: every project's save also rewrites the
+    shared legacy production_plan.json, and saves can run concurrently.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), 0o644)  # mkstemp creates 0600
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
 @dataclass
 class ProjectPaths:
@@ -29,6 +53,15 @@ class ProjectPaths:
     output_file: Path = field(init=False)
     video_script_file: Path = field(init=False)
 
+    # String forms of the paths reported back to MCP clients
+    script_file_str: str = field(init=False)
+    audio_file_str: str = field(init=False)
+    timestamps_file_str: str = field(init=False)
+    images_dir_str: str = field(init=False)
+    output_file_str: str = field(init=False)
+    legacy_audio_str: str = field(init=False)
+    legacy_production_plan_str: str = field(init=False)
+
     def __post_init__(self):
         shorts_dir = self.base_dir / "data" / "shorts"
         self.script_file = shorts_dir / "scripts" / f"{self.project_id}.json"
@@ -43,6 +76,14 @@ class ProjectPaths:
         self.legacy_timestamps = self.base_dir / "data" / "audio" / "elevenlabs" / "dialogue_timestamps.json"
         self.legacy_production_plan = self.base_dir / "data" / "production_plan.json"
 
+        self.script_file_str = os.fspath(self.script_file)
+        self.audio_file_str = os.fspath(self.audio_file)
+        self.timestamps_file_str = os.fspath(self.timestamps_file)
+        self.images_dir_str = os.fspath(self.images_dir)
+        self.output_file_str = os.fspath(self.output_file)
+        self.legacy_audio_str = os.fspath(self.legacy_audio)
+        self.legacy_production_plan_str = os.fspath(self.legacy_production_plan)
+
 
 class ProjectManager:
     """
@@ -85,8 +126,8 @@ class ProjectManager:
         """Load persistent state."""
         if self._state_file.exists():
             try:
-                with open(self._state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self._state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
                     self._current_project_id = state.get("current_project_id")
             except:
                 self._current_project_id = None
@@ -94,8 +135,8 @@ class ProjectManager:
     def _save_state(self):
         """Persist current state."""
         state = {"current_project_id": self._current_project_id}
-        with open(self._state_file, 'w') as f:
-            json.dump(state, f)
+        with open(self._state_file, 'wb') as f:
+            f.write(orjson.dumps(state))
 
     def generate_project_id(self, prefix: str = "lds") -> str:
         """Generate a unique project ID with timestamp."""
@@ -128,24 +169,25 @@ class ProjectManager:
         status = {
             "project_id": paths.project_id,
             "exists": {
-                "script": paths.script_file.exists(),
-                "audio": paths.audio_file.exists(),
-                "timestamps": paths.timestamps_file.exists(),
-                "video": paths.output_file.exists(),
+                "script": os.path.exists(paths.script_file_str),
+                "audio": os.path.exists(paths.audio_file_str),
+                "timestamps": os.path.exists(paths.timestamps_file_str),
+                "video": os.path.exists(paths.output_file_str),
             },
             "paths": {
-                "script": str(paths.script_file),
-                "audio": str(paths.audio_file),
-                "timestamps": str(paths.timestamps_file),
-                "output": str(paths.output_file),
+                "script": paths.script_file_str,
+                "audio": paths.audio_file_str,
+                "timestamps": paths.timestamps_file_str,
+                "output": paths.output_file_str,
             },
             "images": [],
             "ready_for_render": False
         }
 
         # Check images
-        if paths.images_dir.exists():
-            status["images"] = [f.name for f in paths.images_dir.iterdir() if f.is_file()]
+        if os.path.exists(paths.images_dir_str):
+            with os.scandir(paths.images_dir_str) as entries:
+                status["images"] = [e.name for e in entries if e.is_file()]
 
         # Check if ready to render
         status["ready_for_render"] = all([
@@ -182,13 +224,17 @@ class ProjectManager:
         # Ensure directory exists
         paths.script_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Serialize once (same layout as indent=2, ensure_ascii=False)
+        payload = orjson.dumps(
+            script_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+
         # Save script
-        with open(paths.script_file, 'w', encoding='utf-8') as f:
-            json.dump(script_data, f, indent=2, ensure_ascii=False)
+        _write_bytes_atomic(paths.script_file, payload)
 
         # Also save to legacy location for CLI compatibility
-        with open(paths.legacy_production_plan, 'w', encoding='utf-8') as f:
-            json.dump(script_data, f, indent=2, ensure_ascii=False)
+        _write_bytes_atomic(paths.legacy_production_plan, payload)
 
         # Set as current project
         self.set_current_project(pid)
@@ -241,12 +287,14 @@ class ProjectManager:
                         "error": f"Dialogue line {i} has invalid character '{char}'. Must be one of: {valid_chars}"
                     }
 
-            # Try to serialize to ensure it's valid JSON
-            json.dumps(script_data, ensure_ascii=False)
+            # Try to serialize to ensure it's valid JSON. Like json.dumps,
+            # accept non-str keys but reject values JSON can't hold (sets,
+            # bytes, datetimes, ...)
+            orjson.dumps(script_data, option=orjson.OPT_NON_STR_KEYS)
 
             return {"valid": True, "error": None}
 
-        except json.JSONDecodeError as e:
+        except (orjson.JSONEncodeError, TypeError) as e:
             return {"valid": False, "error": f"Invalid JSON: {str(e)}"}
         except Exception as e:
             return {"valid": False, "error": f"Validation error: {str(e)}"}
@@ -256,8 +304,8 @@ class ProjectManager:
         paths = self.get_paths(project_id)
 
         if paths.script_file.exists():
-            with open(paths.script_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(paths.script_file, 'rb') as f:
+                return orjson.loads(f.read())
         return None
 
     def save_audio(self, audio_bytes: bytes, project_id: Optional[str] = None) -> str:
@@ -288,13 +336,14 @@ class ProjectManager:
         # Ensure directory exists
         paths.timestamps_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Serialize once for both copies
+        payload = orjson.dumps(timestamps_data, option=orjson.OPT_INDENT_2)
+
         # Save timestamps
-        with open(paths.timestamps_file, 'w', encoding='utf-8') as f:
-            json.dump(timestamps_data, f, indent=2, ensure_ascii=False)
+        _write_bytes_atomic(paths.timestamps_file, payload)
 
         # Create legacy copy
-        with open(paths.legacy_timestamps, 'w', encoding='utf-8') as f:
-            json.dump(timestamps_data, f, indent=2, ensure_ascii=False)
+        _write_bytes_atomic(paths.legacy_timestamps, payload)
 
         return str(paths.timestamps_file)
 
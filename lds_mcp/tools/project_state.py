@@ -18,7 +18,7 @@ PHASES:
 8. ARCHIVED - Project moved to archive folder
 """
 
-import json
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -26,6 +26,8 @@ from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import orjson
+
 
 class ProjectPhase(Enum):
     """Phases of the video production pipeline."""
@@ -150,6 +152,15 @@ class ProjectState:
         return cls(**data)
 
 
+def _dir_has_suffix(directory: str, suffix: str) -> bool:
+    """True if any entry in directory ends with suffix (stops at the first hit)."""
+    try:
+        with os.scandir(directory) as it:
+            return any(entry.name.endswith(suffix) for entry in it)
+    except OSError:
+        return False
+
+
 class ProjectStateManager:
     """
     Manages project state and lifecycle for the video production pipeline.
@@ -169,6 +180,11 @@ class ProjectStateManager:
         self.shorts_dir = self.base_dir / "data" / "shorts"
         self.archive_dir = self.base_dir / self.ARCHIVE_DIR
 
+        # Plain-string dir prefixes for the per-refresh existence probes
+        self._scripts_dir = os.fspath(self.shorts_dir / "scripts")
+        self._audio_dir = os.fspath(self.shorts_dir / "audio")
+        self._output_dir = os.fspath(self.shorts_dir / "output")
+
         # Ensure directories exist
         self.shorts_dir.mkdir(parents=True, exist_ok=True)
 
@@ -179,8 +195,8 @@ class ProjectStateManager:
         """Load state from file or create new."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                 return ProjectState.from_dict(data)
             except Exception:
                 return ProjectState()
@@ -189,8 +205,8 @@ class ProjectStateManager:
     def _save_state(self) -> None:
         """Save state to file."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_file, 'w') as f:
-            json.dump(self._state.to_dict(), f, indent=2)
+        with open(self.state_file, 'wb') as f:
+            f.write(orjson.dumps(self._state.to_dict(), option=orjson.OPT_INDENT_2))
 
     def _update_timestamp(self) -> None:
         """Update the last_updated timestamp."""
@@ -203,15 +219,11 @@ class ProjectStateManager:
 
         # Check file existence
         pid = self._state.project_id
-        script_path = self.shorts_dir / "scripts" / f"{pid}.json"
-        audio_path = self.shorts_dir / "audio" / f"{pid}.mp3"
-        timestamps_path = self.shorts_dir / "audio" / f"{pid}_timestamps.json"
-        video_path = self.shorts_dir / "output" / f"{pid}.mp4"
-
-        self._state.has_script = script_path.exists()
-        self._state.has_audio = audio_path.exists()
-        self._state.has_timestamps = timestamps_path.exists()
-        self._state.has_video = video_path.exists()
+        exists = os.path.exists
+        self._state.has_script = exists(f"{self._scripts_dir}{os.sep}{pid}.json")
+        self._state.has_audio = exists(f"{self._audio_dir}{os.sep}{pid}.mp3")
+        self._state.has_timestamps = exists(f"{self._audio_dir}{os.sep}{pid}_timestamps.json")
+        self._state.has_video = exists(f"{self._output_dir}{os.sep}{pid}.mp4")
 
         # Determine phase
         if self._state.has_video:
@@ -291,10 +303,11 @@ class ProjectStateManager:
 
     def _has_leftover_files(self) -> bool:
         """Check if there are files from a previous project."""
-        scripts = list((self.shorts_dir / "scripts").glob("*.json")) if (self.shorts_dir / "scripts").exists() else []
-        audio = list((self.shorts_dir / "audio").glob("*.mp3")) if (self.shorts_dir / "audio").exists() else []
-        videos = list((self.shorts_dir / "output").glob("*.mp4")) if (self.shorts_dir / "output").exists() else []
-        return len(scripts) > 0 or len(audio) > 0 or len(videos) > 0
+        return (
+            _dir_has_suffix(self._scripts_dir, ".json")
+            or _dir_has_suffix(self._audio_dir, ".mp3")
+            or _dir_has_suffix(self._output_dir, ".mp4")
+        )
 
     def start_new_project(
         self,
@@ -428,8 +441,8 @@ class ProjectStateManager:
             "hook_text": self._state.hook_text,
             "files": files_archived
         }
-        with open(archive_path / "archive_info.json", "w") as f:
-            json.dump(state_info, f, indent=2)
+        with open(archive_path / "archive_info.json", "wb") as f:
+            f.write(orjson.dumps(state_info, option=orjson.OPT_INDENT_2))
 
         # Reset state
         self._state = ProjectState()
@@ -491,8 +504,8 @@ class ProjectStateManager:
             if item.is_dir():
                 info_file = item / "archive_info.json"
                 if info_file.exists():
-                    with open(info_file) as f:
-                        info = json.load(f)
+                    with open(info_file, "rb") as f:
+                        info = orjson.loads(f.read())
                     projects.append({
                         "folder": item.name,
                         "path": str(item),
@@ -527,18 +540,26 @@ def reset_state_manager() -> None:
 
 
 # Convenience functions for common operations
-def get_welcome_message() -> Dict[str, Any]:
+def get_welcome_message(status: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get a welcome message with current project status.
     Call this at the start of a new chat session.
+
+    Pass a report from get_status_report() to reuse it instead of building
+    a fresh one.
     """
-    manager = get_state_manager()
-    status = manager.get_status_report()
+    if status is None:
+        status = get_state_manager().get_status_report()
 
     phase = status["current_phase"]
 
     # Build welcome message based on state
     if phase["id"] == "idle":
+        notes = "".join(
+            f"\n[!] *Note: {s['message']}*\n"
+            for s in status["suggestions"]
+            if s["action"] == "cleanup_recommended"
+        )
         greeting = f"""
 {phase["emoji"]} **Welcome to Zero-Sum Video Creator!**
 
@@ -547,11 +568,7 @@ No active project detected. Ready to create something new!
 **What would you like to do?**
 1. [NEW] Start a new video project
 2. [ARCHIVE] View archived projects
-"""
-        if status["suggestions"]:
-            for s in status["suggestions"]:
-                if s["action"] == "cleanup_recommended":
-                    greeting += f"\n[!] *Note: {s['message']}*\n"
+{notes}"""
 
     elif phase["id"] == "complete":
         project = status["project"]
@@ -570,6 +587,7 @@ Your video for "{project['topic']}" is ready!
 
     else:
         project = status["project"]
+        next_steps = "".join(f"- {action}\n" for action in status["next_actions"])
         greeting = f"""
 {phase["emoji"]} **Current Project: {project['topic'] or 'Untitled'}**
 
@@ -582,9 +600,7 @@ Your video for "{project['topic']}" is ready!
 - Video: {'[OK]' if status['files']['video'] else '[--]'}
 
 **Next Steps:**
-"""
-        for action in status["next_actions"]:
-            greeting += f"- {action}\n"
+{next_steps}"""
 
     return {
         "message": greeting,
@@ -0,0 +1,80 @@
+"""
+Render status files shared by the MCP server and the render worker.
+
+The server polls render_status.json and render_result.json while the worker
+rewrites them. Every write serializes the payload up front and lands it in
+a temp file of its own that replaces the real one in a single step, so a
+poller never reads a half-written file and concurrent writers (the server
+and the worker both write render_status.json) never share a temp file.
+Progress updates skip fsync; the final states are flushed to disk so a
+crash right after a render can't lose them.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import orjson
+
+# Phases after which the status file stops changing
+TERMINAL_PHASES = frozenset({"complete", "error", "stopped"})
+
+# (epoch second, its local "YYYY-MM-DDTHH:MM:SS") for the timestamp helpers
+_second_cache = (-1, "")
+
+
+def _second_text(sec: int) -> str:
+    global _second_cache
+    cached_sec, text = _second_cache
+    if cached_sec != sec:
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _second_cache = (sec, text)
+    return text
+
+
+def iso_now() -> str:
+    """Local time as datetime.now().isoformat(), formatting the date part once per second."""
+    t = time.time()
+    sec = int(t)
+    return f"{_second_text(sec)}.{int((t - sec) * 1e6):06d}"
+
+
+def log_timestamp() -> str:
+    """Local time as "YYYY-MM-DD HH:MM:SS" for log lines."""
+    return _second_text(int(time.time())).replace("T", " ")
+
+
+def write_status_atomic(
+    path: Union[str, Path],
+    payload: Dict[str, Any],
+    durable: bool = False
+) -> None:
+    """Replace a JSON status file with one write + os.replace (fsync first if durable)."""
+    data = orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2)
+    path = os.fspath(path)
+    # mkstemp opens in binary mode on Windows, so no newline translation
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp"
+    )
+    try:
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o644)  # mkstemp creates 0600
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -12,7 +12,6 @@ Usage:
 import os
 import sys
 import asyncio
-import json
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +19,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from lds_mcp.tools.short_renderer import execute_render, update_render_status, log
+from lds_mcp.tools.render_status import write_status_atomic
 
 
 def main():
@@ -75,12 +75,6 @@ def main():
         print(f"{'=' * 60}")
         sys.stdout.flush()
 
-        # Write final result to a JSON file
-        result_file = shorts_dir / "render_result.json"
-        with open(result_file, "w", encoding="utf-8") as f:
-            result["completed_at"] = datetime.now().isoformat()
-            json.dump(result, f, indent=2)
-
     except Exception as e:
         import traceback
         error_msg = str(e)
@@ -101,6 +95,19 @@ def main():
 
         sys.exit(1)
 
+    # Write final result to a JSON file. Kept out of the try above: a
+    # failure here must not rewrite the render's terminal status as an error.
+    # write_status_atomic stages in a private temp file, so the server's own
+    # status writes can't collide with it.
+    result_file = shorts_dir / "render_result.json"
+    result["completed_at"] = datetime.now().isoformat()
+    try:
+        write_status_atomic(result_file, result, durable=True)
+    except OSError as e:
+        print(f"Could not write {result_file}: {e}")
+        sys.stdout.flush()
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -11,6 +11,7 @@ Key Features:
 - Standardized image loading via ImageLoader
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -23,6 +24,7 @@ from dataclasses import dataclass
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from lds_mcp.tools.project_manager import get_project_manager, ProjectPaths
+from lds_mcp.tools.render_status import TERMINAL_PHASES, iso_now, log_timestamp, write_status_atomic
 from lds_mcp.tools.image_loader import (
     ImageLoader,
     get_image_loader,
@@ -36,10 +38,23 @@ from lds_mcp.tools.image_loader import (
 # Log file for debugging (always visible)
 LOG_FILE = Path(__file__).parent.parent.parent / "data" / "render_log.txt"
 
+# Kept open between log() calls (one write + flush per line instead of
+# open/write/close); clear_log() swaps in a truncated handle.
+_log_handle = None
+
+
+def _open_log(mode: str):
+    global _log_handle
+    if _log_handle is not None:
+        _log_handle.close()
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _log_handle = open(LOG_FILE, mode, encoding="utf-8", buffering=1 << 16)
+    return _log_handle
+
 
 def log(message: str, level: str = "INFO"):
     """Log to stderr AND to a file so we can always see what's happening."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = log_timestamp()
     log_line = f"[{timestamp}][{level}] {message}"
 
     # Always print to stderr (Claude Desktop might capture it)
@@ -47,9 +62,9 @@ def log(message: str, level: str = "INFO"):
 
     # Also write to log file (guaranteed to be visible)
     try:
-        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(log_line + "\n")
+        f = _log_handle if _log_handle is not None and not _log_handle.closed else _open_log("a")
+        f.write(log_line + "\n")
+        f.flush()  # Pollers tail the file while the render runs
     except Exception:
         pass  # Don't fail if we can't write to log
 
@@ -57,9 +72,9 @@ def log(message: str, level: str = "INFO"):
 def clear_log():
     """Clear the log file at the start of a new render."""
     try:
-        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LOG_FILE, "w", encoding="utf-8") as f:
-            f.write(f"=== Render Log Started at {datetime.now()} ===\n")
+        f = _open_log("w")
+        f.write(f"=== Render Log Started at {datetime.now()} ===\n")
+        f.flush()
     except Exception:
         pass
 
@@ -76,12 +91,11 @@ def update_render_status(phase: str, message: str, progress: float = 0, extra: d
             "phase": phase,
             "message": message,
             "progress": round(progress, 1),
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": iso_now(),
         }
         if extra:
             status.update(extra)
-        with open(STATUS_FILE, "w", encoding="utf-8") as f:
-            json.dump(status, f, indent=2)
+        write_status_atomic(STATUS_FILE, status, durable=phase in TERMINAL_PHASES)
     except Exception:
         pass
 
@@ -732,8 +746,9 @@ async def _auto_generate_timestamps(
         print(f"[TIMESTAMPS] Generating from: {audio_path}")
         print(f"[TIMESTAMPS] Script segments: {len(script_content)}")
 
-        # Generate timestamps
-        result_path = generate_timestamps_from_audio(
+        # Generate timestamps (Whisper runs for minutes: keep it off the event loop)
+        result_path = await asyncio.to_thread(
+            generate_timestamps_from_audio,
             audio_file=str(audio_path),
             output_file=str(timestamps_path),
             script_content=script_content,
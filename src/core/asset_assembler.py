@@ -3,6 +3,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
+
 # Mapping of legacy pose ID prefixes to standard ones
 # Standard: skeptic_*, analyst_* (matches images_catalog.json)
 POSE_ID_ALIASES = {
@@ -156,19 +158,14 @@ class VideoAnimationBuilder:
 
     def _validate_segment_words(self, segment):
         """Validates that words are within the segment time range"""
-        start_time = segment.get('start', 0)
-        end_time = segment.get('end', 0)
-        words = segment.get('words', [])
-        
-        filtered_words = []
-        for word in words:
-            word_start = word.get('start', 0)
-            word_end = word.get('end', 0)
-            
-            if word_start >= start_time - 0.1 and word_end <= end_time + 0.1:
-                filtered_words.append(word)
+        # Bounds are fixed per segment, so compute the tolerance window once
+        lower = segment.get('start', 0) - 0.1
+        upper = segment.get('end', 0) + 0.1
         
-        return filtered_words
+        return [
+            word for word in segment.get('words', [])
+            if word.get('start', 0) >= lower and word.get('end', 0) <= upper
+        ]
 
     def build_video_plan(self, timestamps_path: str, images_path: str, output_path: str):
         print("📂 Loading data files for enrichment...")
@@ -221,6 +218,13 @@ class VideoAnimationBuilder:
             
             if visual_assets and isinstance(visual_assets, list) and visual_assets:
                 filtered_assets = [va for va in visual_assets if va.get('visual_asset_id') != used_opening_id]
+                # Word timing as parallel lists, indexed directly per asset
+                starts = [w['start'] for w in words]
+                ends = [w['end'] for w in words]
+                last_idx = len(words) - 1
+                # Whole-segment window for assets without word indices
+                seg_start = starts[0] if words else segment.get('start', 0)
+                seg_end = ends[-1] if words else segment.get('end', 0)
                 
                 for va in filtered_assets:
                     visual_id = va.get('visual_asset_id')
@@ -232,13 +236,11 @@ class VideoAnimationBuilder:
                     end_idx = va.get('end_word_index')
                     
                     if start_idx is not None and words:
-                        start_idx = max(0, min(start_idx, len(words) - 1))
-                        end_idx = max(start_idx, min(end_idx or start_idx, len(words) - 1))
-                        start_t = words[start_idx]['start']
-                        end_t = words[end_idx]['end']
+                        start_idx = max(0, min(start_idx, last_idx))
+                        end_idx = max(start_idx, min(end_idx or start_idx, last_idx))
+                        start_t = starts[start_idx]
+                        end_t = ends[end_idx]
                     else:
-                        seg_start = words[0]['start'] if words else segment.get('start', 0)
-                        seg_end = words[-1]['end'] if words else segment.get('end', 0)
                         start_t, end_t = seg_start, seg_end
             
                     contextual_images.append({
@@ -302,8 +304,9 @@ class VideoAnimationBuilder:
         }
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes directly (same layout as indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
         
         print(f"\n✅ Video plan created: {output_path}")
         return output_path
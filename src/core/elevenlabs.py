@@ -3,95 +3,125 @@ ElevenLabs audio generation - Implemented as a simple function.
 Ref: https://elevenlabs.io/docs/api-reference/text-to-dialogue
 """
 
+import asyncio
+import functools
+import hashlib
 import os
+import shutil
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 from elevenlabs import save
-from elevenlabs.client import ElevenLabs
+from elevenlabs.client import AsyncElevenLabs, ElevenLabs
 
 load_dotenv()
 
-def generate_audio_from_script(dialogue: list[dict], output_file: str, voice_id_skeptic: str, voice_id_analyst: str) -> str:
-    # 1. Validate API Key
+MAX_CHARS = 5000
+MODEL_ID = "eleven_v3"  # Recomendado para baja latencia y buen manejo de tags
+OUTPUT_FORMAT = "mp3_44100_128"
+
+
+def _get_api_key() -> str:
     api_key = os.getenv("ELEVEN_LABS_API_KEY2")
     if not api_key:
         raise ValueError("[ERROR] ELEVEN_LABS_API_KEY2 not found in environment variables.")
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str) -> ElevenLabs:
+    """
+    One sync client per process, so long-lived callers (the MCP server) keep
+    its HTTP connection pool instead of a new TCP/TLS handshake per call.
+    The async client is not shared: its pool is tied to one event loop.
+    """
+    return ElevenLabs(api_key=api_key)
+
+
+def _build_batches(dialogue: list[dict], voice_id_skeptic: str, voice_id_analyst: str) -> list[list[dict]]:
+    # La API de Text to Dialogue maneja listas, pero para evitar timeouts o limites
+    # excesivos en diálogos muy largos, mantenemos un batching conservador (aprox 5k caracteres).
+    batches = []
+    current_batch = []
+    current_chars = 0
+
+    for line in dialogue:
+        # NOTA: Ya no extraemos 'emotion_tag' porque el nuevo JSON incluye
+        # los tags de audio (ej: [smug], <break>) directamente en el texto.
+        text = line.get("text", line.get("line", ""))
+        character = line.get("character", "")
+
+        # Voice ID assignment priority:
+        # 1. Use voice_id from the dialogue line if explicitly provided
+        # 2. Map by character name (supports multiple aliases)
+        # 3. Default to analyst voice
+
+        if "voice_id" in line and line["voice_id"]:
+            # Use explicit voice_id from dialogue line
+            voice_id = line["voice_id"]
+        else:
+            # Map by character name - support multiple aliases
+            # Skeptic names -> male voice (Charles)
+            # Analyst names -> female voice (Eve)
+            skeptic_names = {"Skeptic", "Brother Marcus", "skeptic", "brother marcus"}
+            analyst_names = {"Analyst", "Sister Faith", "analyst", "sister faith"}
+
+            if character in skeptic_names:
+                voice_id = voice_id_skeptic
+            elif character in analyst_names:
+                voice_id = voice_id_analyst
+            else:
+                # Default to analyst for unknown characters
+                voice_id = voice_id_analyst
+                print(f"[AUDIO] Warning: Unknown character '{character}', using analyst voice")
+
+        # Preparar objeto input según documentación oficial
+        input_item = {
+            "text": text,
+            "voice_id": voice_id
+        }
+
+        line_len = len(text)
+
+        # Verificar limite de caracteres para cerrar el batch actual
+        if current_chars + line_len > MAX_CHARS and current_batch:
+            batches.append(current_batch)
+            current_batch = []
+            current_chars = 0
+
+        current_batch.append(input_item)
+        current_chars += line_len
+
+    if current_batch:
+        batches.append(current_batch)
+
+    return batches
+
+
+def generate_audio_from_script(dialogue: list[dict], output_file: str, voice_id_skeptic: str, voice_id_analyst: str) -> str:
+    # 1. Validate API Key
+    api_key = _get_api_key()
 
     # 2. Initialize Client
     try:
-        elevenlabs = ElevenLabs(api_key=api_key)
+        elevenlabs = _get_client(api_key)
         
         # 3. Batching Logic
-        # La API de Text to Dialogue maneja listas, pero para evitar timeouts o limites
-        # excesivos en diálogos muy largos, mantenemos un batching conservador (aprox 5k caracteres).
-        MAX_CHARS = 5000 
-        batches = []
-        current_batch = []
-        current_chars = 0
-        
-        for line in dialogue:
-            # NOTA: Ya no extraemos 'emotion_tag' porque el nuevo JSON incluye
-            # los tags de audio (ej: [smug], <break>) directamente en el texto.
-            text = line.get("text", line.get("line", ""))
-            character = line.get("character", "")
-
-            # Voice ID assignment priority:
-            # 1. Use voice_id from the dialogue line if explicitly provided
-            # 2. Map by character name (supports multiple aliases)
-            # 3. Default to analyst voice
-
-            if "voice_id" in line and line["voice_id"]:
-                # Use explicit voice_id from dialogue line
-                voice_id = line["voice_id"]
-            else:
-                # Map by character name - support multiple aliases
-                # Skeptic names -> male voice (Charles)
-                # Analyst names -> female voice (Eve)
-                skeptic_names = {"Skeptic", "Brother Marcus", "skeptic", "brother marcus"}
-                analyst_names = {"Analyst", "Sister Faith", "analyst", "sister faith"}
-
-                if character in skeptic_names:
-                    voice_id = voice_id_skeptic
-                elif character in analyst_names:
-                    voice_id = voice_id_analyst
-                else:
-                    # Default to analyst for unknown characters
-                    voice_id = voice_id_analyst
-                    print(f"[AUDIO] Warning: Unknown character '{character}', using analyst voice")
-
-            # Preparar objeto input según documentación oficial
-            input_item = {
-                "text": text,
-                "voice_id": voice_id
-            }
-
-            line_len = len(text)
-            
-            # Verificar limite de caracteres para cerrar el batch actual
-            if current_chars + line_len > MAX_CHARS and current_batch:
-                batches.append(current_batch)
-                current_batch = []
-                current_chars = 0
-            
-            current_batch.append(input_item)
-            current_chars += line_len
-            
-        if current_batch:
-            batches.append(current_batch)
+        batches = _build_batches(dialogue, voice_id_skeptic, voice_id_analyst)
 
         print(f"[AUDIO] Generating audio in {len(batches)} batches...")
         
         # 4. Generator function to stream audio
         def audio_generator():
             for i, batch in enumerate(batches):
-                print(f"[AUDIO] Processing batch {i+1}/{len(batches)} with model 'eleven_v3'...")
+                print(f"[AUDIO] Processing batch {i+1}/{len(batches)} with model '{MODEL_ID}'...")
                 
                 # Llamada a la API: Text to Dialogue
                 # Docs: https://elevenlabs.io/docs/api-reference/text-to-dialogue
                 audio_stream = elevenlabs.text_to_dialogue.convert(
                     inputs=batch,
-                    model_id="eleven_v3", # Recomendado para baja latencia y buen manejo de tags
-                    output_format="mp3_44100_128"
+                    model_id=MODEL_ID,
+                    output_format=OUTPUT_FORMAT
                 )
                 
                 # Yield bytes from the stream efficiently
@@ -113,4 +143,108 @@ def generate_audio_from_script(dialogue: list[dict], output_file: str, voice_id_
     except Exception as e:
         error_msg = f"[ERROR] ElevenLabs API error: {str(e)}"
         print(f"\n{error_msg}")
-        raise RuntimeError(error_msg)
\ No newline at end of file
+        raise RuntimeError(error_msg)
+
+
+def _batch_cache_key(batch: list[dict]) -> str:
+    """Content address of a batch: model, format and every (voice_id, text) pair."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{MODEL_ID}\x00{OUTPUT_FORMAT}".encode("utf-8"))
+    for item in batch:
+        h.update(f"\x01{item['voice_id']}\x00{item['text']}".encode("utf-8"))
+    return h.hexdigest()
+
+
+async def generate_audio_from_script_async(
+    dialogue: list[dict],
+    output_file: str,
+    voice_id_skeptic: str,
+    voice_id_analyst: str,
+    max_concurrent: int = 8,
+    cache_dir: Optional[str] = None,
+    force: bool = False
+) -> str:
+    """
+    Same output as generate_audio_from_script, but all batches are requested
+    concurrently (bounded by max_concurrent) instead of one after another.
+
+    Each batch streams straight into its own part file next to the output;
+    the parts are then byte-concatenated in dialogue order. MP3 frames of
+    the same format join cleanly, so nothing is decoded or re-encoded and
+    no batch is held fully in memory.
+
+    If cache_dir is given, every batch is stored there under a hash of its
+    voices and text, and unchanged batches are reused on later runs instead
+    of calling the API again (unless force=True).
+    """
+    api_key = _get_api_key()
+
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path = Path(cache_dir) if cache_dir else None
+    if cache_path:
+        cache_path.mkdir(parents=True, exist_ok=True)
+    part_paths = []
+
+    try:
+        elevenlabs = AsyncElevenLabs(api_key=api_key)
+        batches = _build_batches(dialogue, voice_id_skeptic, voice_id_analyst)
+        part_paths = [output_path.with_name(f"{output_path.name}.part{i}") for i in range(len(batches))]
+        sources = list(part_paths)
+
+        print(f"[AUDIO] Generating audio in {len(batches)} concurrent batches...")
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def render_batch(i: int, batch: list[dict]) -> None:
+            cached = cache_path / f"{_batch_cache_key(batch)}.mp3" if cache_path else None
+            if cached and not force and cached.exists():
+                print(f"[AUDIO] Batch {i+1}/{len(batches)} unchanged, using cache")
+                sources[i] = cached
+                return
+
+            async with semaphore:
+                print(f"[AUDIO] Processing batch {i+1}/{len(batches)} with model '{MODEL_ID}'...")
+                with open(part_paths[i], "wb") as part:
+                    async for chunk in elevenlabs.text_to_dialogue.convert(
+                        inputs=batch,
+                        model_id=MODEL_ID,
+                        output_format=OUTPUT_FORMAT
+                    ):
+                        part.write(chunk)
+
+            if cached:
+                os.replace(part_paths[i], cached)
+                sources[i] = cached
+
+        # Fail fast: the first failing batch cancels the rest, so no more paid
+        # requests go out, and every task has stopped writing its part file
+        # before the cleanup below removes them
+        tasks = [asyncio.create_task(render_batch(i, batch)) for i, batch in enumerate(batches)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+        with open(output_path, "wb") as out:
+            for source in sources:
+                with open(source, "rb") as part:
+                    shutil.copyfileobj(part, out)
+
+        success_msg = f"[SUCCESS] Audio successfully saved to {output_file}"
+        print(f"\n{success_msg}")
+        return success_msg
+
+    except Exception as e:
+        error_msg = f"[ERROR] ElevenLabs API error: {str(e)}"
+        print(f"\n{error_msg}")
+        raise RuntimeError(error_msg)
+
+    finally:
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
@@ -0,0 +1,128 @@
+"""
+Fast loading of the generated video-script JSON files.
+
+The analysis scripts at the repository root all read the same
+data/video-script.json produced by the asset assembler. Parsing it with
+orjson straight from a memory map avoids the text-mode decode and the
+extra copy that json.load(open(...)) pays on every run. Repeated runs can
+reuse a pickle sidecar (<file>.pkl) that is rebuilt whenever the JSON
+file's mtime or size changes.
+
+Most tools never look at the per-word timing (the "words" arrays with their
+animation frames), which is by far the bulk of each segment. They can ask
+for a slim copy that drops it, cached in its own sidecar.
+"""
+
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import orjson
+
+# Below this size a single read() is cheaper than setting up a mapping
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _strip_words(data: Dict[str, Any]) -> Dict[str, Any]:
+    for segment in data.get('video_plan', []):
+        segment.pop('words', None)
+    return data
+
+
+def _intern_characters(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Share one string object per character name across segments and words."""
+    intern = sys.intern
+    for segment in data.get('video_plan', []):
+        character = segment.get('character')
+        if character:
+            segment['character'] = intern(character)
+        for word in segment.get('words', ()):
+            character = word.get('character')
+            if character:
+                word['character'] = intern(character)
+    return data
+
+
+def load_script(path: Union[str, Path], keep_words: bool = True) -> Dict[str, Any]:
+    """Load a video-script JSON file (must be UTF-8, as orjson requires)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            # Also covers empty files, which cannot be mapped
+            data = orjson.loads(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                data = orjson.loads(view)
+
+    if not keep_words:
+        _strip_words(data)
+    return _intern_characters(data)
+
+
+def _sidecar_path(path: Union[str, Path], keep_words: bool = True) -> Path:
+    path = Path(path)
+    if keep_words:
+        return path.with_name(path.name + '.pkl')
+    return path.with_name(f"{path.stem}.slim{path.suffix}.pkl")
+
+
+def _source_key(path: Union[str, Path]) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_sidecar(
+    path: Union[str, Path],
+    key: tuple,
+    keep_words: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Return the cached document if the sidecar matches the source key."""
+    try:
+        with open(_sidecar_path(path, keep_words), 'rb') as f:
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or stale pickles fail in many ways (EOFError,
+        # ValueError, AttributeError, ImportError, ...); all mean "rebuild"
+        return None
+
+
+def load_cached(path: Union[str, Path], keep_words: bool = True) -> Dict[str, Any]:
+    """
+    Load a video-script JSON file through its pickle sidecar.
+
+    The sidecar holds the source (mtime_ns, size) followed by the parsed
+    document, so a stale cache is rejected before the payload is read.
+    With keep_words=False the slim document (no per-word timing) is
+    cached separately.
+    """
+    key = _source_key(path)
+    data = _read_sidecar(path, key, keep_words)
+    if data is not None:
+        return data
+
+    data = load_script(path, keep_words)
+
+    sidecar = _sidecar_path(path, keep_words)
+    try:
+        # A private temp file: other processes may be filling the same cache
+        fd, tmp = tempfile.mkstemp(dir=sidecar.parent, prefix=f".{sidecar.name}.", suffix='.tmp')
+    except OSError:
+        return data  # Caching is best-effort (e.g. read-only checkout)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, sidecar)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+    return data
+